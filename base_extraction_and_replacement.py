@@ -3,20 +3,42 @@ Menu-driven base extraction and replacement tool.
 Temporary entry point for testing features.
 """
 
+import array
 import json
 import os
+import re
+import sys
 import time
 from pathlib import Path
 from datetime import datetime
-import tkinter as tk
-from tkinter import filedialog
 from utils import SaveFileManager
 
+# Faster compact JSON serialization (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Get the project root directory
 _PROJECT_ROOT = Path(__file__).parent
 _OUTPUT_DIR = _PROJECT_ROOT / "output"
 _OUTPUT_DIR.mkdir(exist_ok=True)
 
+# Characters replaced with "_" in default base file names, one for one
+_SANITIZE = re.compile(r'[ /\\]')
+
+# Static menu text, built once
+_SEP = "=" * 80
+_BANNER = f"{_SEP}\nBASE EXTRACTION AND REPLACEMENT\n{_SEP}"
+_MENU_STATIC_TAIL = "5. Exit\n\n"
+
+# ANSI escape to clear the screen and move the cursor home
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Running an empty command once makes the Windows console honour ANSI escapes
+if sys.platform == 'win32':
+    os.system('')
+
 
 class BaseManager:
     """Manages base extraction and replacement operations using SaveFileManager."""
@@ -24,7 +46,14 @@ class BaseManager:
     def __init__(self):
         self.save_manager = SaveFileManager()
         self.extracted_bases = []
-        self.base_indices_map = {}  # Maps display index to (master_index, base_data)
+        # Display fields and master indices, parallel to extracted_bases
+        self._names = []
+        self._types = []
+        self._owners = []
+        self._modes = []
+        self._master_idx = array.array('i')
+        # Hidden Tk root shared by the file dialogs, created on first use
+        self._tk_root = None
     
     @property
     def save_file_json_path(self):
@@ -59,29 +88,39 @@ class BaseManager:
             print("Error: No save file loaded")
             return False
         
-        # Get bases by type
-        extracted = []
-        self.base_indices_map = {}
-        display_index = 0
-        
-        # Get all bases and filter
-        all_bases = self.save_manager.get_bases()
-        for master_index, base in enumerate(all_bases):
-            base_type = base.get("BaseType", {}).get("PersistentBaseTypes", "")
-            if base_type in base_types:
-                extracted.append(base)
-                self.base_indices_map[display_index] = (master_index, base)
-                display_index += 1
+        # Filter by type in one pass over the bases array
+        matches = self.save_manager.get_bases_by_types(base_types)
+        extracted = [base for _, base in matches]
         
         self.extracted_bases = extracted
+        self._master_idx = array.array('i', [master_index for master_index, _ in matches])
+        self._names, self._types, self._owners, self._modes = [], [], [], []
+        
+        # Single pass with the bound methods held in locals
+        display_fields = self._display_fields
+        add_name, add_type = self._names.append, self._types.append
+        add_owner, add_mode = self._owners.append, self._modes.append
+        for base in extracted:
+            name, base_type, owner_usn, game_mode = display_fields(base)
+            add_name(name)
+            add_type(base_type)
+            add_owner(owner_usn)
+            add_mode(game_mode)
         
         if not extracted:
             print("\nNo bases found matching the selected types.")
             return False
         
-        # Export using SaveFileManager
+        # Export using SaveFileManager. The files list the bases grouped by
+        # type in base_types order (as export_bases does when it filters
+        # itself), so regroup the save-ordered matches instead of rescanning
+        by_type = {}
+        for base, base_type in zip(extracted, self._types):
+            by_type.setdefault(base_type, []).append(base)
+        export = [base for base_type in base_types for base in by_type.get(base_type, ())]
+        
         try:
-            json_file, csv_file = self.save_manager.export_bases(base_types)
+            json_file, csv_file = self.save_manager.export_bases(base_types, bases=export)
             print(f"\n✓ Extracted {len(extracted)} bases")
             print(f"✓ Saved to: {Path(json_file).name}")
             print(f"✓ CSV exported to: {Path(csv_file).name}")
@@ -99,26 +138,37 @@ class BaseManager:
         print(f"\n{'#':<4} {'Name':<25} {'Type':<22} {'Owner USN':<25} {'GameMode':<12}")
         print("-" * 90)
         
-        for display_idx, base in enumerate(self.extracted_bases):
-            name = base.get("Name", "Unknown")
-            base_type = base.get("BaseType", {}).get("PersistentBaseTypes", "Unknown")
-            owner_usn = base.get("Owner", {}).get("USN", "Unknown")
-            game_mode = base.get("GameMode", {}).get("PresetGameMode", "Unknown")
-            
-            # Truncate long names
-            if len(name) > 23:
-                name = name[:20] + "..."
-            if len(owner_usn) > 23:
-                owner_usn = owner_usn[:20] + "..."
-            
+        rows = zip(self._names, self._types, self._owners, self._modes)
+        for display_idx, (name, base_type, owner_usn, game_mode) in enumerate(rows):
             print(f"{display_idx:<4} {name:<25} {base_type:<22} {owner_usn:<25} {game_mode:<12}")
     
+    @staticmethod
+    def _display_fields(base: dict):
+        """Get the (name, type, owner USN, game mode) shown for a base in the list."""
+        name = base.get("Name", "Unknown")
+        base_type = base.get("BaseType", {}).get("PersistentBaseTypes", "Unknown")
+        owner_usn = base.get("Owner", {}).get("USN", "Unknown")
+        game_mode = base.get("GameMode", {}).get("PresetGameMode", "Unknown")
+        
+        # Truncate long names
+        if len(name) > 23:
+            name = name[:20] + "..."
+        if len(owner_usn) > 23:
+            owner_usn = owner_usn[:20] + "..."
+        
+        return name, base_type, owner_usn, game_mode
+    
     def get_base_by_display_index(self, display_index: int):
         """Get base data and master index by display index."""
-        if display_index not in self.base_indices_map:
+        if not 0 <= display_index < len(self._master_idx):
             return None, None
-        master_index, base_data = self.base_indices_map[display_index]
-        return master_index, base_data
+        return self._master_idx[display_index], self.extracted_bases[display_index]
+    
+    def update_extracted_base(self, display_index: int, new_base_data: dict):
+        """Update an extracted base and its display fields after it was replaced."""
+        self.extracted_bases[display_index] = new_base_data
+        (self._names[display_index], self._types[display_index],
+         self._owners[display_index], self._modes[display_index]) = self._display_fields(new_base_data)
     
     def replace_base_in_master(self, master_index: int, new_base_data: dict):
         """Replace a base in the master save file."""
@@ -130,19 +180,36 @@ class BaseManager:
             print(f"Error: {e}")
             return False
     
-    def save_base_to_file(self, base_data: dict, display_index: int):
-        """Save a single base to a JSON file using tkinter file dialog."""
-        # Create root window and hide it
-        root = tk.Tk()
-        root.withdraw()
+    def _get_tk_root(self):
+        """Get the hidden Tk root used as the parent of file dialogs."""
+        if self._tk_root is None:
+            import tkinter as tk
+            self._tk_root = tk.Tk()
+            self._tk_root.withdraw()
+        return self._tk_root
+    
+    def close(self):
+        """Release the hidden Tk root, if one was created."""
+        if self._tk_root is not None:
+            self._tk_root.destroy()
+            self._tk_root = None
+    
+    def save_base_to_file(self, base_data: dict, display_index: int, pretty: bool = True):
+        """Save a single base to a JSON file using tkinter file dialog.
+        
+        Set pretty=False to write compact JSON, which is faster to write and re-load.
+        """
+        from tkinter import filedialog
         
         base_name = base_data.get("Name", "Unknown")
         base_type = base_data.get("BaseType", {}).get("PersistentBaseTypes", "Unknown")
-        default_filename = f"base_{base_name}_{base_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        default_filename = default_filename.replace(" ", "_").replace("/", "_")
+        default_filename = _SANITIZE.sub(
+            "_", f"base_{base_name}_{base_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
         
         # Open save dialog
         file_path = filedialog.asksaveasfilename(
+            parent=self._get_tk_root(),
             title="Save Base JSON",
             initialdir=str(_OUTPUT_DIR),
             initialfile=default_filename,
@@ -150,15 +217,20 @@ class BaseManager:
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         
-        root.destroy()
-        
         if not file_path:
             print("Save cancelled.")
             return None
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(base_data, f, indent=4, ensure_ascii=False)
+            # Serialize first so the file is written in one call
+            if pretty:
+                buf = json.dumps(base_data, indent=4, ensure_ascii=False).encode('utf-8')
+            elif orjson is not None:
+                buf = orjson.dumps(base_data, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                buf = json.dumps(base_data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+            with open(file_path, 'wb') as f:
+                f.write(buf)
             print(f"Base saved to: {file_path}")
             return file_path
         except Exception as e:
@@ -167,20 +239,17 @@ class BaseManager:
     
     def load_base_from_file(self):
         """Load a base from a JSON file using tkinter file dialog."""
-        # Create root window and hide it
-        root = tk.Tk()
-        root.withdraw()
+        from tkinter import filedialog
         
         # Open file dialog
         file_path = filedialog.askopenfilename(
+            parent=self._get_tk_root(),
             title="Load Base JSON",
             initialdir=str(_OUTPUT_DIR),
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         
-        root.destroy()
-        
         if not file_path:
             print("Load cancelled.")
             return None
@@ -205,22 +274,19 @@ class BaseManager:
             return False
 
 
-def select_json_file():
+def select_json_file(manager: BaseManager):
     """Select a JSON file using tkinter file dialog."""
-    # Create root window and hide it
-    root = tk.Tk()
-    root.withdraw()
+    from tkinter import filedialog
     
     # Open file dialog starting from project root
     file_path = filedialog.askopenfilename(
+        parent=manager._get_tk_root(),
         title="Select Save File JSON",
         initialdir=str(_PROJECT_ROOT),
         defaultextension=".json",
         filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
     )
     
-    root.destroy()
-    
     if not file_path:
         print("File selection cancelled.")
         return None
@@ -230,9 +296,9 @@ def select_json_file():
 
 def extract_type_menu():
     """Menu to select what to extract."""
-    print("\n" + "="*80)
+    print("\n" + _SEP)
     print("SELECT BASE TYPES TO EXTRACT")
-    print("="*80)
+    print(_SEP)
     print("1. 🚢 Corvettes (PlayerShipBase)")
     print("2. 🪐 Planetary Bases (ExternalPlanetBase)")
     print("3. Both (Corvettes + Planetary)")
@@ -260,9 +326,9 @@ def base_selection_menu(manager: BaseManager):
         return None
     
     while True:
-        print("\n" + "="*80)
+        print("\n" + _SEP)
         manager.display_bases()
-        print("="*80)
+        print(_SEP)
         print("\nEnter base number to select, or 'back' to return to main menu:")
         choice = input("Choice: ").strip().lower()
         
@@ -281,6 +347,17 @@ def base_selection_menu(manager: BaseManager):
             input("Press Enter to continue...")
 
 
+def _base_details(base_data: dict):
+    """Get the (name, type, owner USN, game mode, object count) shown in the base detail menu."""
+    return (
+        base_data.get("Name", "Unknown"),
+        base_data.get("BaseType", {}).get("PersistentBaseTypes", "Unknown"),
+        base_data.get("Owner", {}).get("USN", "Unknown"),
+        base_data.get("GameMode", {}).get("PresetGameMode", "Unknown"),
+        len(base_data.get("Objects", [])),
+    )
+
+
 def base_detail_menu(manager: BaseManager, display_index: int):
     """Menu for individual base operations."""
     master_index, base_data = manager.get_base_by_display_index(display_index)
@@ -288,51 +365,50 @@ def base_detail_menu(manager: BaseManager, display_index: int):
         print("❌ Error: Invalid base index")
         return
     
-    base_name = base_data.get("Name", "Unknown")
-    base_type = base_data.get("BaseType", {}).get("PersistentBaseTypes", "Unknown")
-    owner_usn = base_data.get("Owner", {}).get("USN", "Unknown")
-    game_mode = base_data.get("GameMode", {}).get("PresetGameMode", "Unknown")
-    num_objects = len(base_data.get("Objects", []))
+    # Looked up once; only refreshed when the base is replaced
+    base_name, base_type, owner_usn, game_mode, num_objects = _base_details(base_data)
     
     while True:
-        print("\n" + "="*80)
+        print("\n" + _SEP)
         print(f"BASE DETAILS: {base_name}")
-        print("="*80)
+        print(_SEP)
         print(f"Type: {base_type}")
         print(f"Owner: {owner_usn}")
         print(f"Game Mode: {game_mode}")
         print(f"Objects: {num_objects}")
-        print("="*80)
+        print(_SEP)
         print()
         print("1. 💾 Save base JSON to file")
-        print("2. 📂 Load base JSON from file (replace this base)")
-        print("3. ← Back to base list")
+        print("2. 💾 Save base JSON to file (compact)")
+        print("3. 📂 Load base JSON from file (replace this base)")
+        print("4. ← Back to base list")
         print()
         
         choice = input("Select option: ").strip()
         
-        if choice == "1":
-            result = manager.save_base_to_file(base_data, display_index)
+        if choice in ("1", "2"):
+            result = manager.save_base_to_file(base_data, display_index, pretty=(choice == "1"))
             if result:
                 print("✓ Base saved successfully!")
             input("\nPress Enter to continue...")
-        elif choice == "2":
+        elif choice == "3":
             new_base_data = manager.load_base_from_file()
             if new_base_data:
-                print("\n" + "="*80)
+                print("\n" + _SEP)
                 print("⚠️  REPLACEMENT CONFIRMATION")
-                print("="*80)
+                print(_SEP)
                 print(f"Current base: {base_name} ({base_type})")
                 new_name = new_base_data.get("Name", "Unknown")
                 new_type = new_base_data.get("BaseType", {}).get("PersistentBaseTypes", "Unknown")
                 print(f"New base: {new_name} ({new_type})")
-                print("="*80)
+                print(_SEP)
                 confirm = input("\nReplace base? (yes/no): ").strip().lower()
                 if confirm == "yes":
                     if manager.replace_base_in_master(master_index, new_base_data):
                         # Update the extracted bases list
-                        manager.extracted_bases[display_index] = new_base_data
-                        manager.base_indices_map[display_index] = (master_index, new_base_data)
+                        manager.update_extracted_base(display_index, new_base_data)
+                        base_data = new_base_data
+                        base_name, base_type, owner_usn, game_mode, num_objects = _base_details(base_data)
                         print("✓ Base replaced successfully!")
                         print("⚠️  Remember to save changes to the save file!")
                     else:
@@ -340,7 +416,7 @@ def base_detail_menu(manager: BaseManager, display_index: int):
                 else:
                     print("Replacement cancelled.")
                 input("\nPress Enter to continue...")
-        elif choice == "3":
+        elif choice == "4":
             break
         else:
             print("❌ Invalid option.")
@@ -351,64 +427,61 @@ def main_menu(manager: BaseManager):
     """Main menu."""
     while True:
         # Clear screen and show status
-        os.system('cls' if os.name == 'nt' else 'clear')
-        
-        print("="*80)
-        print("BASE EXTRACTION AND REPLACEMENT")
-        print("="*80)
+        lines = [_CLEAR_SCREEN + _BANNER]
         
         # Status information
         if manager.save_file_json_path:
             file_name = Path(manager.save_file_json_path).name
-            print(f"📁 Loaded: {file_name}")
+            lines.append(f"📁 Loaded: {file_name}")
         else:
-            print("📁 Loaded: None")
+            lines.append("📁 Loaded: None")
         
         if manager.extracted_bases:
-            print(f"📊 Bases extracted: {len(manager.extracted_bases)}")
+            lines.append(f"📊 Bases extracted: {len(manager.extracted_bases)}")
         else:
-            print("📊 Bases extracted: None")
+            lines.append("📊 Bases extracted: None")
         
         if manager.has_changes:
-            print("⚠️  Status: CHANGES PENDING - Save required!")
+            lines.append("⚠️  Status: CHANGES PENDING - Save required!")
         else:
-            print("✓ Status: No unsaved changes")
+            lines.append("✓ Status: No unsaved changes")
         
-        print("="*80)
-        print()
+        lines.append(_SEP + "\n")
         
         # Menu options
-        print("1. Load save file JSON" + (" [RELOAD]" if manager.save_file_json_path else ""))
+        lines.append("1. Load save file JSON" + (" [RELOAD]" if manager.save_file_json_path else ""))
         if manager.master_save_dict:
             if not manager.extracted_bases:
-                print("2. Extract bases ⚠ REQUIRED")
+                lines.append("2. Extract bases ⚠ REQUIRED")
             else:
-                print("2. Re-extract bases (change type selection)")
+                lines.append("2. Re-extract bases (change type selection)")
         else:
-            print("2. Extract bases (load file first)")
+            lines.append("2. Extract bases (load file first)")
         
         if manager.extracted_bases:
-            print("3. View & Select base")
+            lines.append("3. View & Select base")
         else:
-            print("3. View & Select base (extract bases first)")
+            lines.append("3. View & Select base (extract bases first)")
         
         if manager.has_changes:
-            print("4. 💾 Save changes to save file JSON [REQUIRED]")
+            lines.append("4. 💾 Save changes to save file JSON [REQUIRED]")
         else:
-            print("4. Save changes (no changes to save)")
+            lines.append("4. Save changes (no changes to save)")
         
-        print("5. Exit")
-        print()
+        lines.append(_MENU_STATIC_TAIL)
+        
+        # Draw the whole menu with a single write
+        sys.stdout.write("\n".join(lines))
         
         choice = input("Select option: ").strip()
         
         if choice == "1":
-            file_path = select_json_file()
+            file_path = select_json_file(manager)
             if file_path:
                 if manager.load_save_file(file_path):
                     # Auto-prompt for extraction if bases not extracted
                     if not manager.extracted_bases and manager.master_save_dict:
-                        print("\n" + "="*80)
+                        print("\n" + _SEP)
                         print("Would you like to extract bases now?")
                         print("1. Yes, extract now")
                         print("2. No, do it later")
@@ -444,7 +517,7 @@ def main_menu(manager: BaseManager):
                 continue
             
             if manager.has_changes:
-                print("\n" + "="*80)
+                print("\n" + _SEP)
                 print("⚠️  WARNING: This will overwrite the original file!")
                 print(f"File: {manager.save_file_json_path}")
                 confirm = input("\nSave changes? (yes/no): ").strip().lower()
@@ -474,7 +547,10 @@ def main_menu(manager: BaseManager):
 def main():
     """Entry point."""
     manager = BaseManager()
-    main_menu(manager)
+    try:
+        main_menu(manager)
+    finally:
+        manager.close()
 
 
 if __name__ == "__main__":
@@ -10,9 +10,12 @@ deobfuscate keys using the MBINCompiler mapping.
 """
 
 import json
+import re
 import sys
 import os
-import io
+import mmap
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -29,13 +32,23 @@ except ImportError:
     map_keys = None
     get_mapping = None
 
+# Faster JSON parsing/serialization (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Set to False to force the standard library json module
+_FAST_JSON = orjson is not None
 
-def uint32(data: bytes) -> int:
-    """Convert 4 bytes to a little endian unsigned integer."""
-    return int.from_bytes(data, byteorder='little', signed=False) & 0xffffffff
+# Matches '{' (group 1) or '}' for the brace-matching fallback
+_BRACE_PATTERN = re.compile(rb'(\{)|\}')
 
+# Block header: magic, compressed size, uncompressed size, padding
+_BLOCK_HEADER = struct.Struct('<IIII')
 
-def decompress_save_file(data):
+
+def decompress_save_file(data, max_workers=1):
     """
     Decompresses a No Man's Sky save file that uses LZ4 compression.
     
@@ -49,75 +62,114 @@ def decompress_save_file(data):
       - Compressed data
     """
     size = len(data)
-    din = io.BytesIO(data)
-    out = bytearray()
+    pos = 0
+    blocks = []
     
-    while din.tell() < size:
-        magic = uint32(din.read(4))
+    # First pass: collect (offset, compressed size, uncompressed size) for
+    # every block so the output size is known up front
+    while pos + _BLOCK_HEADER.size <= size:
+        magic, compressedSize, uncompressedSize, _ = _BLOCK_HEADER.unpack_from(data, pos)
         if magic != 0xfeeda1e5:
-            # If we're not at a block boundary, try to find the next block
-            # or we've reached the end
-            if din.tell() >= size:
-                break
-            # Try to find the next block
-            remaining = din.read()
-            next_block = remaining.find(b'\xe5\xa1\xed\xfe')
+            # If we're not at a block boundary, search for the next block in
+            # place rather than copying the rest of the file
+            next_block = data.find(b'\xe5\xa1\xed\xfe', pos + 4)
             if next_block == -1:
                 break
-            din.seek(din.tell() - len(remaining) + next_block)
-            magic = uint32(din.read(4))
-            if magic != 0xfeeda1e5:
-                break
+            pos = next_block
+            continue
         
-        compressedSize = uint32(din.read(4))
-        uncompressedSize = uint32(din.read(4))
-        din.seek(4, 1)  # skip 4 bytes padding
-        compressed_data = din.read(compressedSize)
+        pos += _BLOCK_HEADER.size
         
-        if len(compressed_data) < compressedSize:
+        if pos + compressedSize > size:
             break
         
+        blocks.append((pos, compressedSize, uncompressedSize))
+        pos += compressedSize
+    
+    # Second pass: decompress each block straight into its slot of a
+    # buffer allocated once, instead of growing the output per block.
+    # The view is released before returning so an mmap can be closed.
+    out = bytearray(sum(block[2] for block in blocks))
+    out_pos = 0
+    
+    with memoryview(data) as view:
+        def decompress_block(block):
+            offset, compressedSize, uncompressedSize = block
+            return lz4.block.decompress(
+                view[offset:offset + compressedSize], uncompressed_size=uncompressedSize
+            )
+        
+        # lz4 releases the GIL while decompressing, so blocks can be
+        # decompressed on several threads; results still arrive in order
+        pool = None
+        if max_workers > 1 and len(blocks) > 1:
+            pool = ThreadPoolExecutor(max_workers=min(max_workers, len(blocks)))
+            decompressed_blocks = pool.map(decompress_block, blocks)
+        else:
+            decompressed_blocks = map(decompress_block, blocks)
+        
         try:
-            decompressed_block = lz4.block.decompress(compressed_data, uncompressed_size=uncompressedSize)
-            out += decompressed_block
+            for decompressed_block in decompressed_blocks:
+                out[out_pos:out_pos + len(decompressed_block)] = decompressed_block
+                out_pos += len(decompressed_block)
         except Exception as e:
             print(f"Warning: Failed to decompress block: {e}")
-            break
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
     
-    return bytes(out)
+    # Drop any slack left by blocks smaller than their declared size
+    del out[out_pos:]
+    return out
 
 
-def extract_json_from_hg(hg_file_path):
+def extract_json_from_hg(hg_file_path, max_workers=1):
     """
     Extract JSON from a No Man's Sky .hg save file.
     
     This function:
-    1. Reads the .hg file
+    1. Memory-maps the .hg file
     2. Decompresses it using LZ4
     3. Parses the JSON (which has obfuscated keys)
     """
-    with open(hg_file_path, 'rb') as f:
-        data = f.read()
-    
     # Check for header magic bytes
-    if len(data) < 18:
+    if os.path.getsize(hg_file_path) < 18:
         raise ValueError("File too short to be a valid save file")
     
+    # Map the file rather than reading it into memory; the OS pages it in
+    # as the blocks are decompressed
+    with open(hg_file_path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
     # The header is 18 bytes, but the LZ4 blocks start after it
     # Actually, looking at the decompressor, it seems the blocks might start at the beginning
     # Let's try decompressing from the start
-    decompressed_data = decompress_save_file(data)
+    try:
+        decompressed_data = decompress_save_file(mm, max_workers)
+    finally:
+        mm.close()
     
     if len(decompressed_data) == 0:
         raise ValueError("Failed to decompress file - might not be a valid save file")
     
-    # The decompressed data should be pure JSON
+    # orjson parses the bytes directly. The JSON is usually followed by a null
+    # terminator, so leave that out; anything else orjson rejects falls
+    # through to the recovery path below.
+    if _FAST_JSON:
+        end = len(decompressed_data)
+        while end and decompressed_data[end - 1] == 0:
+            end -= 1
+        try:
+            return orjson.loads(memoryview(decompressed_data)[:end])
+        except orjson.JSONDecodeError:
+            pass
+    
+    # The decompressed data should be pure JSON. json.loads accepts the UTF-8
+    # bytes directly, so only the recovery paths below need a str.
     try:
-        json_str = decompressed_data.decode('utf-8')
-        
         # Try to parse the JSON
         try:
-            data = json.loads(json_str)
+            data = json.loads(decompressed_data)
             return data
         except json.JSONDecodeError as e:
             # If there's "Extra data", it means we parsed a complete JSON object
@@ -125,28 +177,30 @@ def extract_json_from_hg(hg_file_path):
             if "Extra data" in str(e):
                 # Use JSONDecoder to parse just the first object
                 decoder = json.JSONDecoder()
-                obj, idx = decoder.raw_decode(json_str)
+                obj, idx = decoder.raw_decode(decompressed_data.decode('utf-8'))
                 return obj
             else:
                 # Other JSON errors - try to find the first complete object
-                json_start = json_str.find('{')
+                json_start = decompressed_data.find(b'{')
                 if json_start == -1:
                     raise ValueError(f"Could not find JSON in decompressed data: {e}")
                 
-                # Try to find the matching closing brace
+                # Try to find the matching closing brace. The regex engine skips
+                # from brace to brace in C; braces inside strings are counted
+                # too, which the json.loads below catches.
                 brace_count = 0
                 end_pos = -1
-                for i in range(json_start, len(json_str)):
-                    if json_str[i] == '{':
+                for match in _BRACE_PATTERN.finditer(decompressed_data, json_start):
+                    if match.lastindex:
                         brace_count += 1
-                    elif json_str[i] == '}':
+                    else:
                         brace_count -= 1
                         if brace_count == 0:
-                            end_pos = i + 1
+                            end_pos = match.end()
                             break
                 
                 if end_pos > 0:
-                    partial_json = json_str[json_start:end_pos]
+                    partial_json = decompressed_data[json_start:end_pos]
                     data = json.loads(partial_json)
                     return data
                 else:
@@ -158,13 +212,17 @@ def extract_json_from_hg(hg_file_path):
 
 def main():
     """Main entry point"""
+    global _FAST_JSON
+    
     if len(sys.argv) < 2:
         print("No Man's Sky Save File Extractor with Key Mapping")
         print("=" * 60)
-        print("\nUsage: python extract_nms_save_improved.py <input.hg> [output.json] [--no-map] [--mapping mapping.json]")
+        print("\nUsage: python extract_nms_save_improved.py <input.hg> [output.json] [--no-map] [--mapping mapping.json] [--threads N] [--stdlib-json]")
         print("\nOptions:")
         print("  --no-map          Don't apply key mapping (output obfuscated keys)")
         print("  --mapping FILE    Use a local mapping file instead of downloading")
+        print("  --threads N       Decompress save blocks on N threads")
+        print("  --stdlib-json     Use the standard json module even if orjson is installed")
         print("\nExample:")
         print("  python extract_nms_save_improved.py sources/save7.hg save7_extracted.json")
         print("  python extract_nms_save_improved.py sources/save7.hg output.json --no-map")
@@ -177,11 +235,21 @@ def main():
     output_file = None
     apply_mapping = True
     mapping_file = None
+    threads = 1
     
     i = 0
     while i < len(args):
         if args[i] == "--no-map":
             apply_mapping = False
+        elif args[i] == "--stdlib-json":
+            _FAST_JSON = False
+        elif args[i] == "--threads" and i + 1 < len(args):
+            try:
+                threads = max(1, int(args[i + 1]))
+            except ValueError:
+                print(f"Error: --threads expects a number, got '{args[i + 1]}'")
+                sys.exit(1)
+            i += 1
         elif args[i] == "--mapping" and i + 1 < len(args):
             mapping_file = args[i + 1]
             i += 1
@@ -209,7 +277,7 @@ def main():
     print("Decompressing and parsing...")
     
     try:
-        data = extract_json_from_hg(input_file)
+        data = extract_json_from_hg(input_file, threads)
         
         # Apply key mapping if requested and available
         if apply_mapping and map_keys and get_mapping:
@@ -225,9 +293,13 @@ def main():
             print("Warning: Key mapping not available (key_mapper.py not found)")
             print("  Output will contain obfuscated keys")
         
-        # Save to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Save to file, serializing first so it is written in one call
+        if _FAST_JSON:
+            buf = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            buf = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        with open(output_file, 'wb') as f:
+            f.write(buf)
         
         print(f"\n✓ Successfully extracted JSON!")
         print(f"  File: {output_file}")
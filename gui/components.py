@@ -4,8 +4,40 @@ Reusable GUI components with modern styling
 
 import tkinter as tk
 from tkinter import ttk
-from .styles import COLORS, FONTS, SPACING, RADIUS
-from .gradient import GradientFrame, create_gradient_frame
+from .styles import COLORS, SPACING, RADIUS, get_tk_font
+from .gradient import GradientFrame, create_gradient_frame, hex_to_rgb, rgb_to_hex
+
+def _set_highlight(widget, color):
+    # Focus events repeat without the focus actually moving; only touch
+    # the widget when the color changes
+    if getattr(widget, '_highlight', None) != color:
+        widget._highlight = color
+        widget.config(highlightbackground=color)
+
+
+def _on_focus_in(event):
+    _set_highlight(event.widget, COLORS['border_focus_teal'])
+
+
+def _on_focus_out(event):
+    _set_highlight(event.widget, COLORS['border'])
+
+
+def _add_focus_highlight(widget, tag):
+    """Route a widget's focus events through one shared class binding"""
+    # Bound once per tag rather than once per widget instance. Class
+    # bindings live in each Tk interpreter, so the bound tags are tracked
+    # on the widget's root window
+    root = widget._root()
+    bound = getattr(root, '_nms_focus_tags', None)
+    if bound is None:
+        bound = root._nms_focus_tags = set()
+    if tag not in bound:
+        widget.bind_class(tag, '<FocusIn>', _on_focus_in)
+        widget.bind_class(tag, '<FocusOut>', _on_focus_out)
+        bound.add(tag)
+    widget.bindtags((tag,) + widget.bindtags())
+
 
 class ModernButton(tk.Button):
     """Modern styled button with hover effects and teal accents"""
@@ -27,13 +59,17 @@ class ModernButton(tk.Button):
         
         self.disabled_bg = COLORS['bg_tertiary']
         
+        # Slightly darker hover color shown while pressed
+        r, g, b = hex_to_rgb(self.hover_bg)
+        self.pressed_bg = rgb_to_hex((max(0, r - 20), max(0, g - 20), max(0, b - 20)))
+        
         super().__init__(
             parent,
             text=text,
             command=command,
             bg=self.default_bg,
             fg=COLORS['text_primary'],
-            font=FONTS['button'],
+            font=get_tk_font('button', parent),
             relief='flat',
             bd=0,
             padx=SPACING['lg'] + 4,
@@ -46,103 +82,76 @@ class ModernButton(tk.Button):
             **kwargs
         )
         
+        # Colors last applied, so handlers can skip config() calls that
+        # wouldn't change anything
+        self._current_colors = (self.default_bg, COLORS['text_primary'])
+        
         self.bind('<Enter>', self._on_enter)
         self.bind('<Leave>', self._on_leave)
         self.bind('<Button-1>', self._on_click)
         self.bind('<ButtonRelease-1>', self._on_release)
     
+    def _set_colors(self, bg, fg=None):
+        """Apply bg (and fg) unless they are already showing"""
+        colors = (bg, fg or self._current_colors[1])
+        if colors != self._current_colors:
+            self._current_colors = colors
+            self.config(bg=colors[0], fg=colors[1])
+    
     def _on_enter(self, event):
         if self['state'] != 'disabled':
-            self.config(bg=self.hover_bg, fg=self.hover_fg)
+            self._set_colors(self.hover_bg, self.hover_fg)
     
     def _on_leave(self, event):
         if self['state'] != 'disabled':
-            self.config(bg=self.default_bg, fg=COLORS['text_primary'])
+            self._set_colors(self.default_bg, COLORS['text_primary'])
     
     def _on_click(self, event):
         if self['state'] != 'disabled':
-            # Slight darken on click
-            rgb = tuple(max(0, c - 20) for c in self._hex_to_rgb(self.hover_bg))
-            darker = self._rgb_to_hex(rgb)
-            self.config(bg=darker)
+            self._set_colors(self.pressed_bg)
     
     def _on_release(self, event):
         if self['state'] != 'disabled':
-            self.config(bg=self.hover_bg)
+            self._set_colors(self.hover_bg)
     
     def _hex_to_rgb(self, hex_color):
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        return hex_to_rgb(hex_color)
     
     def _rgb_to_hex(self, rgb):
-        return '#{:02x}{:02x}{:02x}'.format(int(rgb[0]), int(rgb[1]), int(rgb[2]))
+        return rgb_to_hex(rgb)
     
     def set_disabled(self, disabled=True):
         state = 'disabled' if disabled else 'normal'
         self.config(state=state)
         if disabled:
-            self.config(bg=self.disabled_bg)
+            self._set_colors(self.disabled_bg)
         else:
-            self.config(bg=self.default_bg)
+            self._set_colors(self.default_bg)
 
 
-class ModernFrame(tk.Frame):
-    """Modern styled frame with optional gradient"""
-    
-    def __init__(self, parent, bg=None, gradient=False, gradient_colors=None, **kwargs):
-        if gradient and gradient_colors:
-            # Use gradient frame instead
-            self._is_gradient = True
-            color1, color2 = gradient_colors
-            self._gradient_frame = GradientFrame(
-                parent,
-                color1,
-                color2,
-                direction=kwargs.pop('gradient_direction', 'vertical'),
-                **kwargs
-            )
-        else:
-            self._is_gradient = False
-            bg = bg or COLORS['bg_secondary']
-            super().__init__(
-                parent,
-                bg=bg,
-                **kwargs
-            )
-    
-    def pack(self, *args, **kwargs):
-        if self._is_gradient:
-            return self._gradient_frame.pack(*args, **kwargs)
-        return super().pack(*args, **kwargs)
-    
-    def grid(self, *args, **kwargs):
-        if self._is_gradient:
-            return self._gradient_frame.grid(*args, **kwargs)
-        return super().grid(*args, **kwargs)
+def ModernFrame(parent, bg=None, gradient=False, gradient_colors=None, **kwargs):
+    """Modern styled frame with optional gradient
     
-    def place(self, *args, **kwargs):
-        if self._is_gradient:
-            return self._gradient_frame.place(*args, **kwargs)
-        return super().place(*args, **kwargs)
-    
-    def pack_forget(self):
-        if self._is_gradient:
-            return self._gradient_frame.pack_forget()
-        return super().pack_forget()
-    
-    def __getattr__(self, name):
-        # Delegate to gradient frame if it exists and attribute not found
-        if self._is_gradient and hasattr(self._gradient_frame, name):
-            return getattr(self._gradient_frame, name)
-        # If not gradient or attribute not in gradient frame, raise AttributeError
-        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    Returns the GradientFrame itself when a gradient is requested, otherwise
+    a plain tk.Frame, so no wrapper sits between callers and the widget.
+    """
+    if gradient and gradient_colors:
+        color1, color2 = gradient_colors
+        return GradientFrame(
+            parent,
+            color1,
+            color2,
+            direction=kwargs.pop('gradient_direction', 'vertical'),
+            **kwargs
+        )
+    return tk.Frame(parent, bg=bg or COLORS['bg_secondary'], **kwargs)
 
 
 class ModernLabel(tk.Label):
     """Modern styled label"""
     
     def __init__(self, parent, text, style='default', **kwargs):
-        font = FONTS.get(style, FONTS['default'])
+        font = get_tk_font(style, parent)
         fg = kwargs.pop('fg', COLORS['text_primary'])
         bg = kwargs.pop('bg', COLORS['bg_secondary'])
         
@@ -169,21 +178,14 @@ class ModernEntry(tk.Entry):
             selectforeground=COLORS['text_primary'],
             relief='flat',
             bd=0,
-            font=FONTS['default'],
+            font=get_tk_font('default', parent),
             highlightthickness=2,
             highlightbackground=COLORS['border'],
             highlightcolor=COLORS['border_focus_teal'],
             **kwargs
         )
         
-        self.bind('<FocusIn>', self._on_focus_in)
-        self.bind('<FocusOut>', self._on_focus_out)
-    
-    def _on_focus_in(self, event):
-        self.config(highlightbackground=COLORS['border_focus_teal'])
-    
-    def _on_focus_out(self, event):
-        self.config(highlightbackground=COLORS['border'])
+        _add_focus_highlight(self, 'ModernEntry')
 
 
 class ModernText(tk.Text):
@@ -199,7 +201,7 @@ class ModernText(tk.Text):
             selectforeground=COLORS['text_primary'],
             relief='flat',
             bd=0,
-            font=FONTS['monospace'],
+            font=get_tk_font('monospace', parent),
             highlightthickness=2,
             highlightbackground=COLORS['border'],
             highlightcolor=COLORS['border_focus_teal'],
@@ -207,14 +209,7 @@ class ModernText(tk.Text):
             **kwargs
         )
         
-        self.bind('<FocusIn>', self._on_focus_in)
-        self.bind('<FocusOut>', self._on_focus_out)
-    
-    def _on_focus_in(self, event):
-        self.config(highlightbackground=COLORS['border_focus_teal'])
-    
-    def _on_focus_out(self, event):
-        self.config(highlightbackground=COLORS['border'])
+        _add_focus_highlight(self, 'ModernText')
 
 
 class ModernListbox(tk.Listbox):
@@ -229,25 +224,13 @@ class ModernListbox(tk.Listbox):
             selectforeground=COLORS['text_primary'],
             relief='flat',
             bd=0,
-            font=FONTS['default'],
+            font=get_tk_font('default', parent),
             highlightthickness=2,
             highlightbackground=COLORS['border'],
             highlightcolor=COLORS['border_teal'],
             activestyle='none',
             **kwargs
         )
-        
-        # Bind selection events for better UX
-        self.bind('<Button-1>', self._on_click)
-        self.bind('<Motion>', self._on_motion)
-    
-    def _on_click(self, event):
-        # Add subtle animation effect
-        pass
-    
-    def _on_motion(self, event):
-        # Could add hover effects here
-        pass
 
 
 class StatusBar(tk.Frame):
@@ -274,18 +257,32 @@ class StatusBar(tk.Frame):
             text="Ready",
             bg=COLORS['bg_primary'],
             fg=COLORS['text_secondary'],
-            font=FONTS['small'],
+            font=get_tk_font('small', parent),
             anchor='w',
             padx=SPACING['md']
         )
         self.status_label.pack(side='left', fill='both', expand=True)
         
-        self._gradient_frame.bind('<Configure>', self._update_accent_line)
+        self._accent_pending = False
+        self._accent_width = 0
+        
+        self._gradient_frame.bind('<Configure>', self._schedule_accent_update)
+    
+    def _schedule_accent_update(self, event=None):
+        """Queue an accent line update for when the event loop goes idle"""
+        # Nothing to move if the width didn't change
+        if event is not None and event.width == self._accent_width:
+            return
+        if not self._accent_pending:
+            self._accent_pending = True
+            self._gradient_frame.after_idle(self._update_accent_line)
     
     def _update_accent_line(self, event=None):
         """Update the accent line position"""
+        self._accent_pending = False
         width = self._gradient_frame.winfo_width()
-        if width > 0:
+        if width > 0 and width != self._accent_width:
+            self._accent_width = width
             self._gradient_frame.coords('accent', 0, 0, width, 0)
     
     def pack(self, *args, **kwargs):
@@ -5,6 +5,13 @@ Base editor window for editing base JSON
 import tkinter as tk
 from tkinter import messagebox
 import json
+import difflib
+
+# Faster JSON parsing/serialization (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Try to import pyperclip, fallback to tkinter clipboard if not available
 try:
@@ -13,9 +20,36 @@ try:
 except ImportError:
     HAS_PYPERCLIP = False
 
-from .styles import COLORS, FONTS, SPACING, RADIUS
+from .styles import COLORS, SPACING, RADIUS, get_tk_font
 from .components import ModernButton, ModernFrame, ModernLabel
 
+def _dumps(obj):
+    """Serialize a base for display (2-space indent, non-ASCII kept as is)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _loads(text):
+    """Parse editor text; errors are json.JSONDecodeError either way"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which json accepts
+            pass
+    return json.loads(text)
+
+
+# (base object, its serialized JSON) from the last editor opened
+_json_cache = (None, None)
+
+# Characters inserted per event loop pass when loading large JSON
+_LOAD_CHUNK_CHARS = 256 * 1024
+
+# Lines copied per clipboard_append call in the tkinter clipboard fallback
+_CLIPBOARD_CHUNK_LINES = 5000
+
 
 class EditorWindow:
     """Window for editing base JSON"""
@@ -45,15 +79,23 @@ class EditorWindow:
         self.window.transient(parent)
         self.window.grab_set()
         
-        # Get base data
+        # Get base data. Serializing it can take a while for large bases, so
+        # that is left until the window is up (see _serialize_and_load).
         self.base_data = self.save_editor.selected_base.copy()
-        self.original_json = json.dumps(self.base_data, indent=2, ensure_ascii=False)
+        self.original_json = None
         
         self._create_widgets()
-        self._load_base_data()
+        
+        self.json_text.config(state='normal')
+        self.json_text.insert('1.0', "Loading…")
+        self.json_text.config(state='disabled')
+        self.window.after_idle(self._serialize_and_load)
+        
+        # Everything not needed to show the JSON is built after it
+        self.window.after_idle(self._create_secondary_widgets)
     
     def _create_widgets(self):
-        """Create all widgets in the editor window"""
+        """Create the widgets needed to show and edit the JSON"""
         # Main container with gradient
         main_container = ModernFrame(
             self._window_gradient,
@@ -64,27 +106,18 @@ class EditorWindow:
         main_container.pack(fill='both', expand=True, padx=SPACING['xl'], pady=SPACING['xl'])
         
         # Header with teal accent
-        header_frame = tk.Frame(main_container._gradient_frame, bg=COLORS['bg_secondary'])
+        header_frame = tk.Frame(main_container, bg=COLORS['bg_secondary'])
         header_frame.pack(fill='x', pady=(0, SPACING['md']))
         
         base_name = self.base_data.get("Name", "Unknown")
-        ModernLabel(
+        self._title_label = ModernLabel(
             header_frame,
             text=f"Editing: {base_name}",
             style='heading',
             bg=COLORS['bg_secondary'],
             fg=COLORS['text_primary']
-        ).pack(side='left')
-        
-        # Teal accent dot
-        accent_dot = tk.Label(
-            header_frame,
-            text="●",
-            bg=COLORS['bg_secondary'],
-            fg=COLORS['accent_teal'],
-            font=('Segoe UI', 8)
         )
-        accent_dot.pack(side='left', padx=(SPACING['sm'], 0))
+        self._title_label.pack(side='left')
         
         # Button frame
         button_frame = tk.Frame(header_frame, bg=COLORS['bg_secondary'])
@@ -115,34 +148,8 @@ class EditorWindow:
         self.save_btn.pack(side='left')
         self.save_btn.set_disabled(True)
         
-        # Info note with teal accent
-        info_frame = tk.Frame(main_container._gradient_frame, bg=COLORS['bg_tertiary'])
-        info_frame.pack(fill='x', pady=(0, SPACING['md']))
-        
-        # Teal accent border on left
-        accent_border = tk.Frame(info_frame, bg=COLORS['accent_teal'], width=4)
-        accent_border.pack(side='left', fill='y')
-        
-        info_text_frame = tk.Frame(info_frame, bg=COLORS['bg_tertiary'])
-        info_text_frame.pack(side='left', fill='both', expand=True, padx=SPACING['md'], pady=SPACING['sm'])
-        
-        info_text = (
-            "💡 Tip: You can export JSON from djmonkeyuk's base editor using 'Export to NMS' option, "
-            "then paste it here after clicking Edit."
-        )
-        info_label = ModernLabel(
-            info_text_frame,
-            text=info_text,
-            style='small',
-            bg=COLORS['bg_tertiary'],
-            fg=COLORS['text_teal'],
-            wraplength=800,
-            justify='left'
-        )
-        info_label.pack(anchor='w')
-        
         # JSON display/edit area
-        text_frame = tk.Frame(main_container._gradient_frame, bg=COLORS['bg_secondary'])
+        text_frame = tk.Frame(main_container, bg=COLORS['bg_secondary'])
         text_frame.pack(fill='both', expand=True)
         
         # Scrollbar
@@ -159,7 +166,7 @@ class EditorWindow:
             selectforeground=COLORS['text_primary'],
             relief='flat',
             bd=0,
-            font=FONTS['monospace'],
+            font=get_tk_font('monospace', text_frame),
             wrap='none',
             yscrollcommand=scrollbar.set,
             state='disabled'
@@ -167,9 +174,54 @@ class EditorWindow:
         self.json_text.pack(side='left', fill='both', expand=True)
         scrollbar.config(command=self.json_text.yview)
         
+        # Secondary widgets are packed around these later
+        self._main_container = main_container
+        self._text_frame = text_frame
+    
+    def _create_secondary_widgets(self):
+        """Create the decorative and secondary widgets once the window is up"""
+        if not self.window.winfo_exists():
+            return
+        
+        # Teal accent dot
+        accent_dot = tk.Label(
+            self._title_label.master,
+            text="●",
+            bg=COLORS['bg_secondary'],
+            fg=COLORS['accent_teal'],
+            font=('Segoe UI', 8)
+        )
+        accent_dot.pack(side='left', padx=(SPACING['sm'], 0), after=self._title_label)
+        
+        # Info note with teal accent
+        info_frame = tk.Frame(self._main_container, bg=COLORS['bg_tertiary'])
+        info_frame.pack(fill='x', pady=(0, SPACING['md']), before=self._text_frame)
+        
+        # Teal accent border on left
+        accent_border = tk.Frame(info_frame, bg=COLORS['accent_teal'], width=4)
+        accent_border.pack(side='left', fill='y')
+        
+        info_text_frame = tk.Frame(info_frame, bg=COLORS['bg_tertiary'])
+        info_text_frame.pack(side='left', fill='both', expand=True, padx=SPACING['md'], pady=SPACING['sm'])
+        
+        info_text = (
+            "💡 Tip: You can export JSON from djmonkeyuk's base editor using 'Export to NMS' option, "
+            "then paste it here after clicking Edit."
+        )
+        info_label = ModernLabel(
+            info_text_frame,
+            text=info_text,
+            style='small',
+            bg=COLORS['bg_tertiary'],
+            fg=COLORS['text_teal'],
+            wraplength=800,
+            justify='left'
+        )
+        info_label.pack(anchor='w')
+        
         # Close button
-        close_frame = tk.Frame(main_container._gradient_frame, bg=COLORS['bg_secondary'])
-        close_frame.pack(fill='x', pady=(SPACING['md'], 0))
+        close_frame = tk.Frame(self._main_container, bg=COLORS['bg_secondary'])
+        close_frame.pack(fill='x', pady=(SPACING['md'], 0), after=self._text_frame)
         
         ModernButton(
             close_frame,
@@ -178,25 +230,107 @@ class EditorWindow:
             style='secondary'
         ).pack(side='right')
     
+    def _serialize_and_load(self):
+        """Serialize the base (or reuse the last serialization) and show it"""
+        global _json_cache
+        
+        if not self.window.winfo_exists():
+            return
+        
+        # Bases are replaced rather than edited in place, so the same
+        # selected_base object always serializes to the same text
+        source = self.save_editor.selected_base
+        cached_base, cached_json = _json_cache
+        if cached_base is source:
+            self.original_json = cached_json
+        else:
+            self.original_json = _dumps(self.base_data)
+            _json_cache = (source, self.original_json)
+        
+        # Clear the placeholder so the JSON is loaded into an empty widget
+        self.json_text.config(state='normal')
+        self.json_text.delete('1.0', tk.END)
+        self._load_base_data()
+    
     def _load_base_data(self):
         """Load base data into the text widget"""
+        current = self.json_text.get('1.0', 'end-1c')
+        
+        # Leave the text alone if it already shows this JSON (e.g. after a
+        # save); otherwise only rewrite the lines that changed
+        if current != self.original_json:
+            self.json_text.config(state='normal')
+            if not current:
+                self._insert_progressively(self.original_json, 0)
+            else:
+                self._replace_changed_lines(current, self.original_json)
+        self.json_text.config(state='disabled')
+    
+    def _insert_progressively(self, text, start):
+        """Append text to the widget a chunk at a time from the event loop"""
+        if not self.window.winfo_exists():
+            return
+        
+        # Break on a line boundary so each insert ends with whole lines
+        end = text.find('\n', start + _LOAD_CHUNK_CHARS)
+        end = len(text) if end == -1 else end + 1
+        
         self.json_text.config(state='normal')
-        self.json_text.delete('1.0', tk.END)
-        self.json_text.insert('1.0', self.original_json)
+        self.json_text.insert(tk.END, text[start:end])
         self.json_text.config(state='disabled')
+        
+        if end < len(text):
+            # Keep the partial text from being copied or edited until it's all in
+            self.copy_btn.set_disabled(True)
+            self.edit_btn.set_disabled(True)
+            self.window.after_idle(self._insert_progressively, text, end)
+        elif start:
+            self.copy_btn.set_disabled(False)
+            self.edit_btn.set_disabled(False)
+    
+    def _replace_changed_lines(self, old_text, new_text):
+        """Rewrite only the lines that differ between the shown and new text"""
+        old_lines = old_text.split('\n')
+        new_lines = new_text.split('\n')
+        line_count = len(old_lines)
+        
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+        
+        # Work from the bottom up so earlier line numbers stay valid
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == 'equal':
+                continue
+            
+            new_block = '\n'.join(new_lines[j1:j2])
+            if tag == 'replace':
+                self.json_text.delete(f'{i1 + 1}.0', f'{i2}.end')
+                self.json_text.insert(f'{i1 + 1}.0', new_block)
+            elif tag == 'delete':
+                if i2 < line_count:
+                    self.json_text.delete(f'{i1 + 1}.0', f'{i2 + 1}.0')
+                else:
+                    # Trailing lines: take the newline before them instead
+                    self.json_text.delete(f'{i1}.end', f'{i2}.end')
+            elif i1 < line_count:
+                self.json_text.insert(f'{i1 + 1}.0', new_block + '\n')
+            else:
+                self.json_text.insert(f'{line_count}.end', '\n' + new_block)
     
     def _copy_json(self):
         """Copy JSON to clipboard"""
         try:
-            # Get current text from editor
-            current_text = self.json_text.get('1.0', tk.END).strip()
-            
             if HAS_PYPERCLIP:
-                pyperclip.copy(current_text)
+                # 'end-1c' leaves out the newline Tk keeps after the last line
+                pyperclip.copy(self.json_text.get('1.0', 'end-1c'))
             else:
-                # Fallback to tkinter clipboard
+                # Fallback to tkinter clipboard, appended a slice of lines at
+                # a time so the whole document is never held as one string
                 self.window.clipboard_clear()
-                self.window.clipboard_append(current_text)
+                last_line = int(self.json_text.index('end-1c').split('.')[0])
+                for start in range(1, last_line + 1, _CLIPBOARD_CHUNK_LINES):
+                    stop = start + _CLIPBOARD_CHUNK_LINES
+                    end_index = f'{stop}.0' if stop <= last_line else 'end-1c'
+                    self.window.clipboard_append(self.json_text.get(f'{start}.0', end_index))
                 self.window.update()
             
             # Show temporary feedback
@@ -231,7 +365,7 @@ class EditorWindow:
         
         # Validate JSON
         try:
-            new_base_data = json.loads(json_str)
+            new_base_data = _loads(json_str)
         except json.JSONDecodeError as e:
             messagebox.showerror("Invalid JSON", f"The JSON is invalid:\n{e}")
             return
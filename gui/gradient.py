@@ -4,17 +4,25 @@ Since tkinter doesn't support native gradients, we use canvas-based solutions
 """
 
 import tkinter as tk
+from functools import lru_cache
+
+# Pillow (optional) - resizes and uploads the gradient image in C
+try:
+    from PIL import Image, ImageTk
+except ImportError:
+    Image = None
+    ImageTk = None
 
 
 def hex_to_rgb(hex_color):
     """Convert hex color to RGB tuple"""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    value = int(hex_color.lstrip('#'), 16)
+    return (value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff
 
 
 def rgb_to_hex(rgb):
     """Convert RGB tuple to hex color"""
-    return '#{:02x}{:02x}{:02x}'.format(int(rgb[0]), int(rgb[1]), int(rgb[2]))
+    return '#%06x' % ((int(rgb[0]) << 16) | (int(rgb[1]) << 8) | int(rgb[2]))
 
 
 def interpolate_color(color1, color2, factor):
@@ -27,6 +35,36 @@ def interpolate_color(color1, color2, factor):
     return rgb_to_hex((r, g, b))
 
 
+@lru_cache(maxsize=64)
+def blend_colors(color1, color2, factor):
+    """Mix color1 over color2 with the given opacity (0-1)"""
+    # Widgets reblend the same panel/background pair on every redraw, so
+    # each pair is only parsed and mixed once
+    rgb1 = hex_to_rgb(color1)
+    rgb2 = hex_to_rgb(color2)
+    return rgb_to_hex(tuple(
+        int(rgb1[i] * factor + rgb2[i] * (1 - factor))
+        for i in range(3)
+    ))
+
+
+# Shared by every frame and window in the process: the same colors at a
+# size seen before skip the color math
+@lru_cache(maxsize=128)
+def gradient_strip(rgb1, rgb2, steps):
+    """Build the RGB bytes of a one pixel wide gradient strip"""
+    r1, g1, b1 = rgb1
+    r2, g2, b2 = rgb2
+    
+    # Fill each channel with a strided slice assignment rather than
+    # packing pixels one at a time; the blend itself is integer-only
+    pixels = bytearray(steps * 3)
+    pixels[0::3] = bytes((r1 * (steps - i) + r2 * i) // steps for i in range(steps))
+    pixels[1::3] = bytes((g1 * (steps - i) + g2 * i) // steps for i in range(steps))
+    pixels[2::3] = bytes((b1 * (steps - i) + b2 * i) // steps for i in range(steps))
+    return bytes(pixels)
+
+
 class GradientFrame(tk.Canvas):
     """Frame with gradient background"""
     
@@ -42,14 +80,48 @@ class GradientFrame(tk.Canvas):
         self.color2 = color2
         self.direction = direction
         
-        self.bind('<Configure>', self._draw_gradient)
+        # Endpoint colors are parsed once rather than per scanline
+        self._rgb1 = hex_to_rgb(color1)
+        self._rgb2 = hex_to_rgb(color2)
+        
+        # Rendered gradient image (kept referenced so Tk doesn't drop it)
+        self._image = None
+        self._last_size = (0, 0)
+        self._redraw_pending = False
+        
+        # A gradient between identical colors is just a solid background,
+        # which the canvas can paint itself without any image
+        self._solid = self._rgb1 == self._rgb2
+        if self._solid:
+            self.configure(bg=color1)
+        else:
+            self.bind('<Configure>', self._schedule_redraw)
         
         # Store widgets to be placed on this gradient frame
         self._widgets = []
     
+    def _schedule_redraw(self, event=None):
+        """Queue a redraw for when the event loop goes idle"""
+        # Configure also fires for moves and restacking; the event carries
+        # the new size, so those are dropped without asking Tk for it
+        if event is not None and (event.width, event.height) == self._last_size:
+            return
+        
+        # A drag-resize sends a stream of <Configure> events; only the last
+        # size matters, so they all collapse into one pending redraw
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+    
+    def _do_redraw(self):
+        """Run a queued redraw"""
+        self._redraw_pending = False
+        self._draw_gradient()
+    
     def _draw_gradient(self, event=None):
         """Draw the gradient"""
-        self.delete('gradient')
+        if self._solid:
+            return
         
         width = self.winfo_width()
         height = self.winfo_height()
@@ -57,18 +129,34 @@ class GradientFrame(tk.Canvas):
         if width <= 1 or height <= 1:
             return
         
-        if self.direction == 'vertical':
-            # Vertical gradient
-            for i in range(height):
-                factor = i / height
-                color = interpolate_color(self.color1, self.color2, factor)
-                self.create_line(0, i, width, i, fill=color, tags='gradient')
+        # <Configure> fires repeatedly without a size change; nothing to redo then
+        if (width, height) == self._last_size:
+            return
+        self._last_size = (width, height)
+        
+        vertical = self.direction == 'vertical'
+        steps = height if vertical else width
+        
+        pixels = gradient_strip(self._rgb1, self._rgb2, steps)
+        
+        strip_size = (1, steps) if vertical else (steps, 1)
+        if Image is not None:
+            # Stretch the strip to the canvas size with Pillow
+            strip = Image.frombytes('RGB', strip_size, pixels)
+            image = ImageTk.PhotoImage(strip.resize((width, height), Image.NEAREST), master=self)
         else:
-            # Horizontal gradient
-            for i in range(width):
-                factor = i / width
-                color = interpolate_color(self.color1, self.color2, factor)
-                self.create_line(i, 0, i, height, fill=color, tags='gradient')
+            # Hand Tk the whole strip as one binary PPM buffer and stretch it
+            # across the canvas, instead of drawing one line item per pixel
+            header = b'P6 %d %d 255\n' % strip_size
+            strip = tk.PhotoImage(master=self, data=header + pixels, format='PPM')
+            if vertical:
+                image = strip.zoom(width, 1)
+            else:
+                image = strip.zoom(1, height)
+        
+        self.delete('gradient')
+        self.create_image(0, 0, image=image, anchor='nw', tags='gradient')
+        self._image = image
         
         # Lower gradient layer
         self.tag_lower('gradient')
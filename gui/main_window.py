@@ -5,23 +5,83 @@ NMS-Inspired Explorer theme
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
+import base64
 import os
-from pathlib import Path
-from datetime import datetime
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
-from .styles import COLORS, FONTS, SPACING, RADIUS
-from .gradient import GradientFrame
+from .styles import COLORS, SPACING, RADIUS, get_tk_font
 from .starscape import StarscapeCanvas
+from .gradient import hex_to_rgb
 from .nms_components import NMSButton, NMSPanel, PillToggleButton, NMSLabel
 from .components import ModernListbox, StatusBar
 from .editor_window import EditorWindow
 from save_editor import SaveEditor
 
 
+_diamond_png = None
+
+
+def _diamond_icon_png():
+    """
+    Base64 PNG of the 32x32 header diamond and its glow.
+    
+    The glow rings used to be three canvas polygons stacked under the diamond;
+    only the outermost (dimmest) one ever showed around it, so that is the
+    ring drawn here. Encoded once and reused.
+    """
+    global _diamond_png
+    if _diamond_png is None:
+        center, size, glow = 16, 12, 2
+        alpha = 0.4 - glow * 0.1
+        glow_rgba = bytes((int(0 * alpha), int(245 * alpha), int(212 * alpha), 255))
+        diamond_rgba = bytes(hex_to_rgb(COLORS['accent_cyan'])) + b'\xff'
+        clear = bytes(4)
+        
+        rows = []
+        for y in range(32):
+            row = bytearray(b'\x00')  # PNG filter type: none
+            for x in range(32):
+                distance = abs(x + 0.5 - center) + abs(y + 0.5 - center)
+                if distance <= size:
+                    row += diamond_rgba
+                elif distance <= size + glow:
+                    row += glow_rgba
+                else:
+                    row += clear
+            rows.append(bytes(row))
+        
+        def chunk(kind, data):
+            return (struct.pack('>I', len(data)) + kind + data
+                    + struct.pack('>I', zlib.crc32(kind + data)))
+        
+        png = (b'\x89PNG\r\n\x1a\n'
+               + chunk(b'IHDR', struct.pack('>IIBBBBB', 32, 32, 8, 6, 0, 0, 0))
+               + chunk(b'IDAT', zlib.compress(b''.join(rows)))
+               + chunk(b'IEND', b''))
+        _diamond_png = base64.b64encode(png)
+    return _diamond_png
+
+
 class MainWindow:
     """Main application window with NMS-inspired design"""
     
+    # Every attribute the window sets; keeps instances free of a __dict__
+    __slots__ = (
+        'root', 'save_editor', '_io_pool', '_starscape', '_diamond_img',
+        # State
+        'selected_base_index', 'filtered_bases', 'current_base_type_filter',
+        '_dropdown_files', '_display_cache', '_base_indices', '_pending_filter_id',
+        '_busy_buttons',
+        # Widgets
+        'content_panel', 'save_file_var', 'save_file_dropdown', 'load_file_btn',
+        'base_type_section', 'base_type_var', 'corvette_toggle', 'planetary_toggle',
+        'both_toggle', 'bases_section', 'bases_listbox', 'action_frame',
+        'edit_base_btn', 'inject_base_btn', 'status_bar',
+    )
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("No Man's Sky Save Editor")
@@ -33,10 +93,19 @@ class MainWindow:
         # Initialize SaveEditor
         self.save_editor = SaveEditor()
         
+        # Single worker for slow save file work (decompress/recompress), so
+        # the Tk event loop keeps running while it happens
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        
         # State variables
         self.selected_base_index = None
         self.filtered_bases = []
         self.current_base_type_filter = None
+        self._dropdown_files = []  # Save file names in dropdown order
+        self._display_cache = {}  # id(base) -> (base, listbox text)
+        self._base_indices = {}  # id(base) -> (base, index in all_bases)
+        self._pending_filter_id = None  # after() id of a queued filter pass
+        self._busy_buttons = None  # Button states to restore after a background job
         
         # Load save files
         try:
@@ -44,29 +113,41 @@ class MainWindow:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load save files: {e}")
         
+        self._init_ttk_style()
         self._create_widgets()
         self._update_save_file_dropdown()
         self._update_status("Ready")
     
     def _create_background(self):
         """Create gradient background with starscape"""
-        # Main gradient background
-        self._root_gradient = GradientFrame(
-            self.root,
-            COLORS['bg_primary'],
-            COLORS['bg_primary_end'],
-            direction='vertical'
-        )
-        self._root_gradient.pack(fill='both', expand=True)
-        
-        # Starscape overlay (uses gradient background, stars drawn on top)
+        # Gradient and stars are rendered together into one image
         self._starscape = StarscapeCanvas(
-            self._root_gradient,
-            star_count=150
-            # bg will default to parent's background (gradient)
+            self.root,
+            star_count=150,
+            gradient_colors=(COLORS['bg_primary'], COLORS['bg_primary_end'])
         )
         self._starscape.pack(fill='both', expand=True)
     
+    def _init_ttk_style(self):
+        """Set the ttk theme and combobox style before any ttk widget exists"""
+        # Switching themes restyles every ttk widget, so this runs once per
+        # root instead of while building sections
+        style = ttk.Style(self.root)
+        style.theme_use('clam')
+        style.configure('TCombobox',
+                       fieldbackground=COLORS['bg_panel'],
+                       background=COLORS['bg_panel'],
+                       foreground=COLORS['text_primary'],
+                       borderwidth=0,
+                       relief='flat',
+                       padding=8)
+        style.map('TCombobox',
+             fieldbackground=[('readonly', COLORS['bg_panel'])],
+             background=[('readonly', COLORS['bg_panel'])],
+             bordercolor=[('focus', COLORS['border_focus']), ('!focus', COLORS['border'])],
+             lightcolor=[('focus', COLORS['border_focus'])],
+             darkcolor=[('focus', COLORS['border_focus'])])
+    
     def _create_widgets(self):
         """Create all GUI widgets"""
         # Main container
@@ -87,28 +168,9 @@ class MainWindow:
         )
         diamond_canvas.pack(side='left', padx=(0, SPACING['md']))
         
-        # Draw diamond with glow
-        center_x, center_y = 16, 16
-        size = 12
-        # Outer glow
-        for i in range(3):
-            alpha = 0.4 - (i * 0.1)
-            glow_color = f'#{int(0 * alpha):02x}{int(245 * alpha):02x}{int(212 * alpha):02x}'
-            diamond_canvas.create_polygon(
-                center_x, center_y - size - i,
-                center_x + size + i, center_y,
-                center_x, center_y + size + i,
-                center_x - size - i, center_y,
-                fill=glow_color, outline='', tags='glow'
-            )
-        # Diamond shape
-        diamond_canvas.create_polygon(
-            center_x, center_y - size,
-            center_x + size, center_y,
-            center_x, center_y + size,
-            center_x - size, center_y,
-            fill=COLORS['accent_cyan'], outline='', tags='diamond'
-        )
+        # Diamond with glow, pre-rendered into one image
+        self._diamond_img = tk.PhotoImage(master=self.root, data=_diamond_icon_png(), format='png')
+        diamond_canvas.create_image(16, 16, image=self._diamond_img)
         
         # Title
         title_label = NMSLabel(
@@ -167,37 +229,20 @@ class MainWindow:
         input_panel.pack(side='left', fill='x', expand=True, padx=(0, SPACING['md']))
         
         # Dropdown inside panel
-        dropdown_container = tk.Frame(input_panel, bg='')
-        dropdown_container.pack(fill='both', expand=True, padx=SPACING['md'], pady=SPACING['sm'])
-        
         self.save_file_var = tk.StringVar()
         self.save_file_dropdown = ttk.Combobox(
-            dropdown_container,
+            input_panel,
             textvariable=self.save_file_var,
             state='readonly',
-            font=FONTS['default'],
+            font=get_tk_font('default', input_panel),
             width=50
         )
-        self.save_file_dropdown.pack(fill='x')
+        self.save_file_dropdown.pack(fill='x', expand=True, padx=SPACING['md'], pady=SPACING['sm'])
         
-        # Style combobox
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('TCombobox',
-                       fieldbackground=COLORS['bg_panel'],
-                       background=COLORS['bg_panel'],
-                       foreground=COLORS['text_primary'],
-                       borderwidth=0,
-                       relief='flat',
-                       padding=8)
-        style.map('TCombobox',
-             fieldbackground=[('readonly', COLORS['bg_panel'])],
-             background=[('readonly', COLORS['bg_panel'])],
-             bordercolor=[('focus', COLORS['border_focus']), ('!focus', COLORS['border'])],
-             lightcolor=[('focus', COLORS['border_focus'])],
-             darkcolor=[('focus', COLORS['border_focus'])])
+        # Picking a save file loads it straight away
+        self.save_file_dropdown.bind('<<ComboboxSelected>>', self._on_save_file_selected)
         
-        # Load File button
+        # Load File button (kept for reloading the current selection)
         self.load_file_btn = NMSButton(
             dropdown_frame,
             text="Load File",
@@ -244,15 +289,12 @@ class MainWindow:
             fg=COLORS['text_primary']
         ).pack(anchor='w', pady=(0, SPACING['md']))
         
-        # Toggle buttons frame
-        toggle_frame = tk.Frame(self.base_type_section, bg='')
-        toggle_frame.pack(fill='x')
-        
+        # Toggle buttons sit in the row under the title
         self.base_type_var = tk.StringVar(value="both")
         
         # Create pill toggle buttons
         self.corvette_toggle = PillToggleButton(
-            toggle_frame,
+            self.base_type_section,
             text="🚢 Corvettes (PlayerShipBase)",
             variable=self.base_type_var,
             value="PlayerShipBase",
@@ -261,7 +303,7 @@ class MainWindow:
         self.corvette_toggle.pack(side='left', padx=(0, SPACING['md']))
         
         self.planetary_toggle = PillToggleButton(
-            toggle_frame,
+            self.base_type_section,
             text="🪐 Planetary Bases (ExternalPlanetBase)",
             variable=self.base_type_var,
             value="ExternalPlanetBase",
@@ -270,7 +312,7 @@ class MainWindow:
         self.planetary_toggle.pack(side='left', padx=(0, SPACING['md']))
         
         self.both_toggle = PillToggleButton(
-            toggle_frame,
+            self.base_type_section,
             text="Both",
             variable=self.base_type_var,
             value="both",
@@ -297,91 +339,168 @@ class MainWindow:
         listbox_panel = NMSPanel(self.bases_section)
         listbox_panel.pack(fill='both', expand=True)
         
-        # Listbox container
-        listbox_container = tk.Frame(listbox_panel, bg='')
-        listbox_container.pack(fill='both', expand=True, padx=SPACING['md'], pady=SPACING['md'])
-        
         # Scrollbar
-        scrollbar = tk.Scrollbar(listbox_container, bg=COLORS['bg_panel'], troughcolor=COLORS['bg_secondary'])
-        scrollbar.pack(side='right', fill='y')
+        scrollbar = tk.Scrollbar(listbox_panel, bg=COLORS['bg_panel'], troughcolor=COLORS['bg_secondary'])
+        scrollbar.pack(side='right', fill='y', padx=(0, SPACING['md']), pady=SPACING['md'])
         
         # Listbox
-        self.bases_listbox = ModernListbox(listbox_container)
-        self.bases_listbox.pack(side='left', fill='both', expand=True)
+        self.bases_listbox = ModernListbox(listbox_panel)
+        self.bases_listbox.pack(side='left', fill='both', expand=True, padx=(SPACING['md'], 0), pady=SPACING['md'])
         self.bases_listbox.config(yscrollcommand=scrollbar.set)
         scrollbar.config(command=self.bases_listbox.yview)
         self.bases_listbox.bind('<<ListboxSelect>>', self._on_base_selected)
     
     def _set_button_disabled(self, button, disabled=True):
         """Disable/enable NMS button"""
-        if disabled:
-            button.config(state='disabled')
-            # Draw with disabled appearance
-            button.delete('all')
-            button.create_rectangle(0, 0, button.winfo_width(), button.winfo_height(),
-                                  fill=COLORS['bg_tertiary'], outline=COLORS['border'])
-            button.create_text(button.winfo_width() // 2, button.winfo_height() // 2,
-                             text=button.text, fill=COLORS['text_muted'], font=FONTS['button'])
-        else:
-            button.config(state='normal')
-            button._draw_button()
+        # Several paths re-apply the state a button already has; skip those
+        if getattr(button, '_disabled_state', None) == disabled:
+            return
+        button._disabled_state = disabled
+        
+        # The button redraws itself with the matching look
+        button.config(state='disabled' if disabled else 'normal')
     
     def _update_save_file_dropdown(self):
         """Update the save file dropdown with sorted files"""
         if not self.save_editor.save_files:
             return
         
-        # Sort by last modified time (descending)
-        sorted_files = sorted(
-            self.save_editor.save_files,
-            key=lambda x: self.save_editor.get_save_file_metadata(x).get('last_saved', ''),
-            reverse=True
-        )
+        # Look each file's metadata up once for both the sort and the labels
+        metadata = {
+            save_file: self.save_editor.get_save_file_metadata(save_file)
+            for save_file in self.save_editor.save_files
+        }
+        
+        # Sort by last modified time (descending), keyed with a C itemgetter
+        # over (file, last saved) pairs rather than a lambda
+        pairs = [(save_file, metadata[save_file].get('last_saved', '')) for save_file in metadata]
+        pairs.sort(key=itemgetter(1), reverse=True)
+        sorted_files = [save_file for save_file, _ in pairs]
         
         # Create display strings with last modified time
-        display_items = []
-        for save_file in sorted_files:
-            metadata = self.save_editor.get_save_file_metadata(save_file)
-            last_saved = metadata.get('last_saved', 'Unknown')
-            display_items.append(f"{save_file} - {last_saved}")
+        display_items = [
+            f"{save_file} - {metadata[save_file].get('last_saved', 'Unknown')}"
+            for save_file in sorted_files
+        ]
         
+        self._dropdown_files = sorted_files
         self.save_file_dropdown['values'] = display_items
         if display_items:
             self.save_file_dropdown.current(0)
     
     def _load_save_file(self):
         """Load and decompress the selected save file"""
-        selection = self.save_file_dropdown.get()
-        if not selection:
+        index = self.save_file_dropdown.current()
+        if index < 0:
             messagebox.showwarning("Warning", "Please select a save file first.")
             return
         
-        # Extract filename from display string
-        save_file_name = selection.split(' - ')[0]
+        save_file_name = self._dropdown_files[index]
         
         self._update_status(f"Loading {save_file_name}...", 'info')
         self._set_button_disabled(self.load_file_btn, True)
-        self.root.update()
         
-        try:
+        def load():
             # Select and decompress the save file
             self.save_editor.select_save_file(save_file_name)
             self.save_editor.decompress_save_file(save_file_name)
             self.save_editor.load_bases()
+        
+        def on_success(_):
+            self._index_bases()
+            
+            # New bases, so the next toggle must rebuild the list even if
+            # it picks the same type as before
+            self.current_base_type_filter = None
+            
+            # Format every base's row once; filter toggles then reuse them
+            self._flatten_bases()
             
             # Show base type selection
             self.base_type_section.pack(fill='x', pady=(0, SPACING['xl']))
             self._update_status(f"Successfully loaded {save_file_name}", 'success')
-            
-        except Exception as e:
+            self._set_button_disabled(self.load_file_btn, False)
+        
+        def on_error(e):
             messagebox.showerror("Error", f"Failed to load save file:\n{e}")
             self._update_status(f"Error loading file: {e}", 'error')
-        finally:
             self._set_button_disabled(self.load_file_btn, False)
+        
+        self._run_in_background(load, on_success, on_error)
+    
+    def _on_save_file_selected(self, event):
+        """Load a save file as soon as it is picked from the dropdown"""
+        # The Load File button stays disabled while a load is running
+        if getattr(self.load_file_btn, '_disabled_state', False):
+            return
+        self._load_save_file()
+    
+    def _run_in_background(self, work, on_success, on_error):
+        """
+        Run work() on the I/O thread and report back on the Tk thread.
+        
+        Completion is polled with after() because Tk widgets must only be
+        touched from the thread running the main loop.
+        """
+        # The work reads and rewrites save_editor, so nothing that uses it
+        # may run on the Tk thread until it's done
+        self._set_busy(True)
+        future = self._io_pool.submit(work)
+        
+        def check():
+            if not future.done():
+                self.root.after(50, check)
+                return
+            self._set_busy(False)
+            error = future.exception()
+            if error is None:
+                on_success(future.result())
+            else:
+                on_error(error)
+        
+        self.root.after(50, check)
+    
+    def _set_busy(self, busy):
+        """Lock or unlock the controls that use save_editor"""
+        state = 'disabled' if busy else 'normal'
+        for toggle in (self.corvette_toggle, self.planetary_toggle, self.both_toggle):
+            toggle.config(state=state)
+        self.bases_listbox.config(state=state)
+        self.save_file_dropdown.config(state='disabled' if busy else 'readonly')
+        
+        buttons = (self.load_file_btn, self.edit_base_btn, self.inject_base_btn)
+        if busy:
+            # Remember each button's state so finishing restores it
+            self._busy_buttons = [getattr(button, '_disabled_state', False) for button in buttons]
+            for button in buttons:
+                self._set_button_disabled(button, True)
+        else:
+            for button, disabled in zip(buttons, self._busy_buttons):
+                self._set_button_disabled(button, disabled)
+            self._busy_buttons = None
     
     def _on_base_type_changed(self):
         """Handle base type selection change"""
+        # Clicking through the toggles quickly would rebuild the list once
+        # per click; restart a short timer so only the last choice is applied
+        if self._pending_filter_id is not None:
+            self.root.after_cancel(self._pending_filter_id)
+        self._pending_filter_id = self.root.after(80, self._apply_filter)
+    
+    def _apply_filter(self):
+        """Filter the bases by the selected type and show them"""
+        self._pending_filter_id = None
+        
+        # A toggle picked just before a background job started waits for it
+        if self._busy_buttons is not None:
+            self._pending_filter_id = self.root.after(80, self._apply_filter)
+            return
+        
         base_type = self.base_type_var.get()
+        
+        # Re-selecting the active filter would rebuild an identical list
+        if base_type == self.current_base_type_filter:
+            return
         self.current_base_type_filter = base_type
         
         if base_type == "both":
@@ -392,20 +511,64 @@ class MainWindow:
         # Update bases list
         self._update_bases_list()
         
-        # Show bases section
-        self.bases_section.pack(fill='both', expand=True)
+        # Show bases section (only packed the first time)
+        if not self.bases_section.winfo_manager():
+            self.bases_section.pack(fill='both', expand=True)
+    
+    def _flatten_bases(self):
+        """Format the listbox row of every base in one pass"""
+        # Done once per load; filter toggles and row refreshes then read
+        # the cached text
+        format_row = self._format_base_row
+        self._display_cache = {
+            id(base): (base, format_row(base)) for base in self.save_editor.all_bases
+        }
+    
+    @staticmethod
+    def _format_base_row(base):
+        """Listbox text for a base"""
+        # Missing sections fall through to "Unknown" without building
+        # throwaway {} defaults
+        name = base.get("Name", "Unknown")
+        base_type = base.get("BaseType")
+        base_type = base_type.get("PersistentBaseTypes", "Unknown") if base_type else "Unknown"
+        owner = base.get("Owner")
+        owner_usn = owner.get("USN", "Unknown") if owner else "Unknown"
+        return f"{name} | {base_type} | Owner: {owner_usn}"
+    
+    def _base_row_text(self, base):
+        """Cached listbox text for a base"""
+        # The base is stored with its text, so a reused id() can't match
+        entry = self._display_cache.get(id(base))
+        if entry is None or entry[0] is not base:
+            entry = self._display_cache[id(base)] = (base, self._format_base_row(base))
+        return entry[1]
+    
+    def _update_bases_row(self, index):
+        """Refresh one listbox row in place, keeping it selected if it was"""
+        was_selected = self.bases_listbox.selection_includes(index)
+        self.bases_listbox.delete(index)
+        self.bases_listbox.insert(index, self._base_row_text(self.filtered_bases[index]))
+        if was_selected:
+            self.bases_listbox.selection_set(index)
     
     def _update_bases_list(self):
         """Update the bases listbox with filtered bases"""
-        self.bases_listbox.delete(0, tk.END)
+        # Format every row first so the listbox is filled with one insert call
+        row_text = self._base_row_text
+        items = [row_text(base) for base in self.filtered_bases]
         
-        for base in self.filtered_bases:
-            name = base.get("Name", "Unknown")
-            base_type = base.get("BaseType", {}).get("PersistentBaseTypes", "Unknown")
-            owner_usn = base.get("Owner", {}).get("USN", "Unknown")
-            
-            display_text = f"{name} | {base_type} | Owner: {owner_usn}"
-            self.bases_listbox.insert(tk.END, display_text)
+        self.bases_listbox.delete(0, tk.END)
+        if items:
+            self.bases_listbox.insert(tk.END, *items)
+    
+    def _index_bases(self):
+        """Map each base in all_bases to its index"""
+        # Keyed by identity rather than name so renamed or same-named bases
+        # still resolve; the base is stored so a reused id() can't match
+        self._base_indices = {
+            id(base): (base, i) for i, base in enumerate(self.save_editor.all_bases)
+        }
     
     def _on_base_selected(self, event):
         """Handle base selection from listbox"""
@@ -421,15 +584,22 @@ class MainWindow:
         base_name = selected_base.get("Name", "Unknown")
         
         # Find the index in all_bases and select it
-        try:
-            self.save_editor.select_base(base_name)
-        except ValueError:
-            # If base not found by name, try to find by matching the base object
-            for i, base in enumerate(self.save_editor.all_bases):
-                if base.get("Name") == base_name:
-                    self.save_editor.selected_base = base
-                    self.save_editor.selected_base_index = i
-                    break
+        entry = self._base_indices.get(id(selected_base))
+        if entry is not None and entry[0] is selected_base:
+            self.save_editor.selected_base = selected_base
+            self.save_editor.selected_base_index = entry[1]
+        else:
+            # Not indexed; fall back to searching all_bases by name
+            try:
+                self.save_editor.select_base(base_name)
+            except ValueError:
+                # Don't leave the previous base selected for Edit/Inject
+                self.save_editor.selected_base = None
+                self.save_editor.selected_base_index = None
+                self._set_button_disabled(self.edit_base_btn, True)
+                self._set_button_disabled(self.inject_base_btn, True)
+                self._update_status(f"Could not find base: {base_name}", 'error')
+                return
         
         # Enable edit button
         self._set_button_disabled(self.edit_base_btn, False)
@@ -451,8 +621,18 @@ class MainWindow:
         """Callback when base is saved in editor"""
         # Update the filtered bases list if needed
         if self.selected_base_index is not None and self.selected_base_index < len(self.filtered_bases):
-            self.filtered_bases[self.selected_base_index] = self.save_editor.selected_base
-            self._update_bases_list()
+            # Drop the replaced base's cached row text and index entry
+            old_base = self.filtered_bases[self.selected_base_index]
+            self._display_cache.pop(id(old_base), None)
+            if self.filtered_bases is self.save_editor.all_bases:
+                self._base_indices.pop(id(old_base), None)
+            
+            # The edited base (possibly renamed) stands in for the original
+            # at the same all_bases index until it's injected
+            new_base = self.save_editor.selected_base
+            self._base_indices[id(new_base)] = (new_base, self.save_editor.selected_base_index)
+            self.filtered_bases[self.selected_base_index] = new_base
+            self._update_bases_row(self.selected_base_index)
         
         # Enable inject button
         self._set_button_disabled(self.inject_base_btn, False)
@@ -478,9 +658,8 @@ class MainWindow:
         
         self._update_status("Injecting base into save file...", 'info')
         self._set_button_disabled(self.inject_base_btn, True)
-        self.root.update()
         
-        try:
+        def inject():
             # Inject the base
             self.save_editor.inject_selected_base_into_save_file()
             
@@ -490,17 +669,23 @@ class MainWindow:
                 self.save_editor.selected_save_file
             )
             self.save_editor.recompress_save_file(output_path=original_path)
+        
+        def on_success(_):
+            # The injected base may have been renamed
+            self._index_bases()
             
             messagebox.showinfo("Success", "Base successfully injected and save file recompressed!")
             self._update_status("Base injected successfully!", 'success')
             
             # Reset state
             self._set_button_disabled(self.inject_base_btn, False)
-            
-        except Exception as e:
+        
+        def on_error(e):
             messagebox.showerror("Error", f"Failed to inject base:\n{e}")
             self._update_status(f"Error: {e}", 'error')
             self._set_button_disabled(self.inject_base_btn, False)
+        
+        self._run_in_background(inject, on_success, on_error)
     
     def _update_status(self, message, status_type='info'):
         """Update status bar"""
@@ -509,3 +694,5 @@ class MainWindow:
     def run(self):
         """Start the GUI main loop"""
         self.root.mainloop()
+        # Let an in-progress save file write finish before exiting
+        self._io_pool.shutdown()
@@ -3,10 +3,57 @@ NMS-Inspired Explorer components
 No Man's Sky-style UI components with gradients, glows, and modern styling
 """
 
+import math
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk
-from .styles import COLORS, FONTS, SPACING, RADIUS
-from .gradient import GradientFrame, hex_to_rgb, rgb_to_hex, interpolate_color
+from .styles import COLORS, SPACING, RADIUS, get_tk_font
+from .gradient import GradientFrame, hex_to_rgb, blend_colors, gradient_strip
+
+
+def _vertical_gradient_image(master, color1, color2, width, height):
+    """Render a top-to-bottom gradient into one PhotoImage"""
+    # A one pixel wide PPM strip, stretched sideways by Tk
+    pixels = gradient_strip(hex_to_rgb(color1), hex_to_rgb(color2), height)
+    strip = tk.PhotoImage(master=master, data=b'P6 1 %d 255\n' % height + pixels, format='PPM')
+    return strip.zoom(width, 1)
+
+
+def _text_size(text, style, master=None):
+    """Size a plain tk.Label would request for text, from font metrics alone"""
+    font = get_tk_font(style, master)
+    # A default label adds 1px of padding and a 1px border on every side
+    return font.measure(text) + 4, font.metrics('linespace') + 4
+
+
+@lru_cache(maxsize=64)
+def _rounded_points(width, height, radius):
+    """Outline of a rounded rectangle at the origin as flat x, y coordinates"""
+    radius = max(1, min(radius, width // 2, height // 2))
+    points = []
+    # Quarter arcs clockwise from the top-right corner; the straight edges
+    # are the gaps between them
+    corners = (
+        (width - radius, radius, -math.pi / 2),
+        (width - radius, height - radius, 0),
+        (radius, height - radius, math.pi / 2),
+        (radius, radius, math.pi),
+    )
+    for cx, cy, start in corners:
+        for i in range(radius + 1):
+            angle = start + (math.pi / 2) * i / radius
+            points.append(cx + radius * math.cos(angle))
+            points.append(cy + radius * math.sin(angle))
+    return tuple(points)
+
+
+def _create_rounded_rectangle(canvas, x1, y1, x2, y2, radius=10, fill='', outline='', width=1, **kwargs):
+    """Draw a rounded rectangle on a canvas as a single polygon item"""
+    # Corner points are computed once per size and shifted into place
+    points = _rounded_points(x2 - x1, y2 - y1, radius)
+    if x1 or y1:
+        points = [c + (x1 if i % 2 == 0 else y1) for i, c in enumerate(points)]
+    return canvas.create_polygon(points, fill=fill, outline=outline, width=width, **kwargs)
 
 
 class NMSButton(tk.Canvas):
@@ -19,16 +66,19 @@ class NMSButton(tk.Canvas):
         self.is_hovered = False
         self.is_pressed = False
         
+        # Rendered gradient images by (width, height, colors)
+        self._image_cache = {}
+        
         # Calculate button size
-        temp_label = tk.Label(parent, text=text, font=FONTS['button'])
-        temp_label.update()
-        text_width = temp_label.winfo_reqwidth()
-        text_height = temp_label.winfo_reqheight()
-        temp_label.destroy()
+        text_width, text_height = _text_size(text, 'button', parent)
         
         width = kwargs.pop('width', text_width + SPACING['xl'] * 2)
         height = kwargs.pop('height', text_height + SPACING['md'] * 2)
         
+        # Size and state are tracked here (from <Configure> and configure())
+        # so drawing doesn't have to query Tk for them
+        self._state = kwargs.get('state', 'normal')
+        
         super().__init__(
             parent,
             width=width,
@@ -37,100 +87,112 @@ class NMSButton(tk.Canvas):
             **kwargs
         )
         
+        self._size = (width, height)
+        self._drawn_size = (0, 0)
+        self._redraw_pending = False
         self._draw_button()
         
+        # Hover and press don't change the drawn button, so the canvas is
+        # only redrawn when its size, text or state changes
+        self.bind('<Configure>', self._on_resize)
         self.bind('<Enter>', self._on_enter)
         self.bind('<Leave>', self._on_leave)
         self.bind('<Button-1>', self._on_click)
         self.bind('<ButtonRelease-1>', self._on_release)
         self.bind('<Motion>', lambda e: self.config(cursor='hand2'))
     
+    def _on_resize(self, event):
+        self._size = (event.width, event.height)
+        # A resize sends a burst of <Configure> events; they collapse into
+        # one redraw once the event loop goes idle
+        if self._size != self._drawn_size and not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+    
+    def _do_redraw(self):
+        """Run a queued redraw"""
+        self._redraw_pending = False
+        self._draw_button()
+    
     def _draw_button(self):
-        """Draw the button with gradient and shadow"""
+        """Draw the button with gradient and shadow, or its disabled look"""
         self.delete('all')
         
-        width = self.winfo_width() or int(self.cget('width'))
-        height = self.winfo_height() or int(self.cget('height'))
+        width, height = self._size
         
         if width <= 1 or height <= 1:
             return
+        self._drawn_size = (width, height)
         
-        # Shadow offset
-        shadow_offset = 3
-        shadow_blur = 4
-        
-        # Draw shadow (multiple layers for soft shadow)
-        for i in range(shadow_blur):
-            shadow_alpha = 0.2 - (i * 0.05)
-            shadow_color = f'#{int(0 * shadow_alpha):02x}{int(0 * shadow_alpha):02x}{int(0 * shadow_alpha):02x}'
-            self.create_oval(
-                shadow_offset + i, shadow_offset + i,
-                width - shadow_offset - i, height - shadow_offset - i,
-                fill=shadow_color, outline='', tags='shadow'
-            )
+        if self._state == 'disabled':
+            self.create_rectangle(0, 0, width, height,
+                                  fill=COLORS['bg_tertiary'], outline=COLORS['border'])
+            self.create_text(width // 2, height // 2,
+                             text=self.text, fill=COLORS['text_muted'], font=get_tk_font('button', self))
+            return
         
-        # Draw gradient background
-        color1, color2 = self.gradient_colors
-        for i in range(height):
-            factor = i / height
-            color = interpolate_color(color1, color2, factor)
-            self.create_line(0, i, width, i, fill=color, tags='gradient')
-        
-        # Add glow effect if hovered
-        if self.is_hovered:
-            glow_color = COLORS['glow_cyan']
-            for i in range(3):
-                alpha = 0.3 - (i * 0.1)
-                glow_rgb = hex_to_rgb(glow_color)
-                glow_alpha = tuple(int(c * alpha) for c in glow_rgb)
-                glow_hex = rgb_to_hex(glow_alpha)
-                self.create_rectangle(
-                    i, i, width - i, height - i,
-                    outline=glow_hex, width=1, tags='glow'
-                )
+        # Gradient background, rendered once per size
+        key = (width, height) + tuple(self.gradient_colors)
+        image = self._image_cache.get(key)
+        if image is None:
+            color1, color2 = self.gradient_colors
+            image = _vertical_gradient_image(self, color1, color2, width, height)
+            self._image_cache[key] = image
+        self.create_image(0, 0, image=image, anchor='nw', tags='gradient')
+        
+        # Shadow over the gradient. The soft shadow layers are all black and
+        # nested inside the outermost one, so that one oval is all that shows.
+        # The hover glow outlines used to be lowered beneath the opaque
+        # gradient where they never showed, so they aren't drawn.
+        shadow_offset = 3
+        self.create_oval(
+            shadow_offset, shadow_offset,
+            width - shadow_offset, height - shadow_offset,
+            fill='#000000', outline='', tags='shadow'
+        )
         
         # Draw text
         self.create_text(
             width // 2, height // 2,
             text=self.text,
             fill=COLORS['text_primary'],
-            font=FONTS['button'],
+            font=get_tk_font('button', self),
             tags='text'
         )
-        
-        # Lower layers
-        self.tag_lower('shadow')
-        self.tag_lower('gradient')
-        if self.is_hovered:
-            self.tag_lower('glow')
-        self.tag_raise('text')
     
     def _on_enter(self, event):
         self.is_hovered = True
-        self._draw_button()
     
     def _on_leave(self, event):
         self.is_hovered = False
         self.is_pressed = False
-        self._draw_button()
     
     def _on_click(self, event):
+        # Canvas bindings still fire when disabled, so ignore the click here
+        if self._state == 'disabled':
+            return
         self.is_pressed = True
-        # Brightness shift on click
-        self._draw_button()
         if self.command:
             self.after(100, self.command)  # Small delay for visual feedback
     
     def _on_release(self, event):
         self.is_pressed = False
-        self._draw_button()
     
-    def configure(self, **kwargs):
-        """Override configure to handle text changes"""
+    def configure(self, cnf=None, **kwargs):
+        """Override configure to handle text and state changes"""
+        if cnf:
+            kwargs = {**cnf, **kwargs}
+        redraw = 'text' in kwargs or 'state' in kwargs
         if 'text' in kwargs:
             self.text = kwargs.pop('text')
+        if 'state' in kwargs:
+            self._state = kwargs['state']
+        result = super().configure(**kwargs)
+        if redraw:
             self._draw_button()
-        return super().configure(**kwargs)
+        return result
+    
+    config = configure
     
     def cget(self, key):
         """Override cget for compatibility"""
@@ -153,32 +215,53 @@ class NMSPanel(tk.Canvas):
             **kwargs
         )
         
-        self.bind('<Configure>', self._draw_panel)
+        self._size = (0, 0)  # Latest size reported by <Configure>
+        self._last_size = (0, 0)
+        self._redraw_pending = False
+        self._panel_item = None  # Canvas id of the panel shape once drawn
+        
+        self.bind('<Configure>', self._schedule_redraw)
+    
+    def _schedule_redraw(self, event=None):
+        """Queue a redraw for when the event loop goes idle"""
+        # Window resizes and drags send <Configure> in bursts; only the
+        # final size needs drawing
+        if event is not None:
+            self._size = (event.width, event.height)
+        if self._size == self._last_size:
+            return
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+    
+    def _do_redraw(self):
+        """Run a queued redraw"""
+        self._redraw_pending = False
+        self._draw_panel()
     
     def _draw_panel(self, event=None):
         """Draw rounded translucent panel"""
-        self.delete('panel')
+        width, height = self._size
         
-        width = self.winfo_width()
-        height = self.winfo_height()
+        # <Configure> also fires for moves; the panel only depends on size
+        if (width, height) == self._last_size:
+            return
         
         if width <= 1 or height <= 1:
             return
+        self._last_size = (width, height)
         
-        # Calculate semi-transparent color
-        bg_rgb = hex_to_rgb(COLORS['bg_panel'])
-        parent_bg = hex_to_rgb(self.cget('bg'))
+        radius = RADIUS['lg']
+        if self._panel_item is not None:
+            # Resizing only moves the existing shape's points
+            self.coords(self._panel_item, _rounded_points(width, height, radius))
+            return
         
-        # Blend with parent background based on alpha
-        blended = tuple(
-            int(bg_rgb[i] * self.alpha + parent_bg[i] * (1 - self.alpha))
-            for i in range(3)
-        )
-        panel_color = rgb_to_hex(blended)
+        # Semi-transparent color: blend with parent background based on alpha
+        panel_color = blend_colors(COLORS['bg_panel'], self.cget('bg') or COLORS['bg_primary'], self.alpha)
         
         # Draw rounded rectangle
-        radius = RADIUS['lg']
-        self.create_rounded_rectangle(
+        self._panel_item = self.create_rounded_rectangle(
             0, 0, width, height,
             radius=radius,
             fill=panel_color,
@@ -190,75 +273,15 @@ class NMSPanel(tk.Canvas):
         self.tag_lower('panel')
     
     def create_rounded_rectangle(self, x1, y1, x2, y2, radius=10, **kwargs):
-        """Create a rounded rectangle using arcs and lines"""
-        # Create rounded rectangle using create_arc and create_line
-        # This is a simplified version - for better results, use create_polygon with calculated points
-        fill = kwargs.pop('fill', '')
-        outline = kwargs.pop('outline', '')
-        width = kwargs.pop('width', 1)
-        
-        # Draw the rounded rectangle using a polygon approximation
-        points = []
-        # Top edge
-        points.extend([x1 + radius, y1, x2 - radius, y1])
-        # Top-right arc
-        for i in range(radius + 1):
-            angle = (90 - (i * 90 / radius)) * 3.14159 / 180
-            points.extend([x2 - radius + radius * (1 - abs(angle - 1.5708) / 1.5708), 
-                          y1 + radius - radius * abs(angle - 1.5708) / 1.5708])
-        # Right edge
-        points.extend([x2, y1 + radius, x2, y2 - radius])
-        # Bottom-right arc
-        for i in range(radius + 1):
-            angle = (0 - (i * 90 / radius)) * 3.14159 / 180
-            points.extend([x2 - radius + radius * abs(angle) / 1.5708,
-                          y2 - radius + radius * abs(angle) / 1.5708])
-        # Bottom edge
-        points.extend([x2 - radius, y2, x1 + radius, y2])
-        # Bottom-left arc
-        for i in range(radius + 1):
-            angle = (270 - (i * 90 / radius)) * 3.14159 / 180
-            points.extend([x1 + radius - radius * abs(angle - 4.71239) / 1.5708,
-                          y2 - radius + radius * abs(angle - 4.71239) / 1.5708])
-        # Left edge
-        points.extend([x1, y2 - radius, x1, y1 + radius])
-        # Top-left arc
-        for i in range(radius + 1):
-            angle = (180 - (i * 90 / radius)) * 3.14159 / 180
-            points.extend([x1 + radius - radius * abs(angle - 3.14159) / 1.5708,
-                          y1 + radius - radius * abs(angle - 3.14159) / 1.5708])
-        
-        # Simplified: use rectangle with rounded corners approximation
-        # Draw main rectangle
-        if fill:
-            self.create_rectangle(x1 + radius, y1, x2 - radius, y2, fill=fill, outline='', **kwargs)
-            self.create_rectangle(x1, y1 + radius, x2, y2 - radius, fill=fill, outline='', **kwargs)
-        # Draw corner arcs
-        if fill:
-            self.create_oval(x1, y1, x1 + radius * 2, y1 + radius * 2, fill=fill, outline='', **kwargs)
-            self.create_oval(x2 - radius * 2, y1, x2, y1 + radius * 2, fill=fill, outline='', **kwargs)
-            self.create_oval(x1, y2 - radius * 2, x1 + radius * 2, y2, fill=fill, outline='', **kwargs)
-            self.create_oval(x2 - radius * 2, y2 - radius * 2, x2, y2, fill=fill, outline='', **kwargs)
-        
-        # Draw outline
-        if outline:
-            # Top
-            self.create_line(x1 + radius, y1, x2 - radius, y1, fill=outline, width=width, **kwargs)
-            # Right
-            self.create_line(x2, y1 + radius, x2, y2 - radius, fill=outline, width=width, **kwargs)
-            # Bottom
-            self.create_line(x2 - radius, y2, x1 + radius, y2, fill=outline, width=width, **kwargs)
-            # Left
-            self.create_line(x1, y2 - radius, x1, y1 + radius, fill=outline, width=width, **kwargs)
-            # Arcs
-            self.create_arc(x1, y1, x1 + radius * 2, y1 + radius * 2, start=90, extent=90, 
-                          outline=outline, width=width, style='arc', **kwargs)
-            self.create_arc(x2 - radius * 2, y1, x2, y1 + radius * 2, start=0, extent=90,
-                          outline=outline, width=width, style='arc', **kwargs)
-            self.create_arc(x1, y2 - radius * 2, x1 + radius * 2, y2, start=180, extent=90,
-                          outline=outline, width=width, style='arc', **kwargs)
-            self.create_arc(x2 - radius * 2, y2 - radius * 2, x2, y2, start=270, extent=90,
-                          outline=outline, width=width, style='arc', **kwargs)
+        """Create a rounded rectangle as a single polygon item"""
+        return _create_rounded_rectangle(self, x1, y1, x2, y2, radius, **kwargs)
+
+
+def _sync_pill_group(variable):
+    """Update every pill bound to a variable from a single read of it"""
+    current = variable.get()
+    for button in variable._pill_buttons:
+        button._check_state(current)
 
 
 class PillToggleButton(tk.Canvas):
@@ -271,12 +294,11 @@ class PillToggleButton(tk.Canvas):
         self.command = command
         self.is_active = False
         
+        # Rendered active-state gradient images by (width, height)
+        self._image_cache = {}
+        
         # Calculate size
-        temp_label = tk.Label(parent, text=text, font=FONTS['default'])
-        temp_label.update()
-        text_width = temp_label.winfo_reqwidth()
-        text_height = temp_label.winfo_reqheight()
-        temp_label.destroy()
+        text_width, text_height = _text_size(text, 'default', parent)
         
         width = kwargs.pop('width', text_width + SPACING['xl'])
         height = kwargs.pop('height', text_height + SPACING['sm'])
@@ -289,21 +311,41 @@ class PillToggleButton(tk.Canvas):
             **kwargs
         )
         
+        # Size (kept current by <Configure>) and the parent's background,
+        # so drawing doesn't have to query Tk for them. A transparent ('')
+        # parent background blends against the window background
+        self._size = (width, height)
+        parent_bg = parent.cget('bg') if hasattr(parent, 'cget') else ''
+        self._parent_bg = parent_bg or COLORS['bg_primary']
+        
         # Check initial state
         self._check_state()
         self._draw_button()
         
-        # Monitor variable changes
-        self.variable.trace_add('write', lambda *args: self._check_state())
+        # Monitor variable changes. All pills sharing a variable are served
+        # by one trace, which reads the value once for the whole group
+        group = getattr(variable, '_pill_buttons', None)
+        if group is None:
+            group = variable._pill_buttons = []
+            variable.trace_add('write', lambda *args: _sync_pill_group(variable))
+        group.append(self)
         
+        self.bind('<Configure>', self._on_resize)
         self.bind('<Button-1>', self._on_click)
         self.bind('<Enter>', self._on_enter)
         self.bind('<Leave>', self._on_leave)
         self.bind('<Motion>', lambda e: self.config(cursor='hand2'))
     
-    def _check_state(self):
+    def _on_resize(self, event):
+        if (event.width, event.height) != self._size:
+            self._size = (event.width, event.height)
+            self._draw_button()
+    
+    def _check_state(self, current=None):
         """Check if this button should be active"""
-        new_state = self.variable.get() == self.value
+        if current is None:
+            current = self.variable.get()
+        new_state = current == self.value
         if new_state != self.is_active:
             self.is_active = new_state
             self._draw_button()
@@ -312,8 +354,7 @@ class PillToggleButton(tk.Canvas):
         """Draw the pill button"""
         self.delete('all')
         
-        width = self.winfo_width() or int(self.cget('width'))
-        height = self.winfo_height() or int(self.cget('height'))
+        width, height = self._size
         
         if width <= 1 or height <= 1:
             return
@@ -321,34 +362,27 @@ class PillToggleButton(tk.Canvas):
         radius = RADIUS['pill']
         
         if self.is_active:
-            # Active: gradient background
-            color1, color2 = COLORS['gradient_active']
-            for i in range(height):
-                factor = i / height
-                color = interpolate_color(color1, color2, factor)
-                self.create_line(0, i, width, i, fill=color, tags='bg')
+            # Active: gradient background, rendered once per size
+            image = self._image_cache.get((width, height))
+            if image is None:
+                color1, color2 = COLORS['gradient_active']
+                image = _vertical_gradient_image(self, color1, color2, width, height)
+                self._image_cache[(width, height)] = image
+            self.create_image(0, 0, image=image, anchor='nw', tags='bg')
             
-            # Add shadow for active state
+            # Add shadow for active state (the inner layer is black and
+            # hidden under the outer one, so only the outer one is drawn)
             shadow_offset = 2
-            for i in range(2):
-                shadow_alpha = 0.15 - (i * 0.05)
-                shadow_color = f'#{int(0 * shadow_alpha):02x}{int(0 * shadow_alpha):02x}{int(0 * shadow_alpha):02x}'
-                self.create_oval(
-                    shadow_offset + i, shadow_offset + i,
-                    width - shadow_offset - i, height - shadow_offset - i,
-                    fill=shadow_color, outline='', tags='shadow'
-                )
+            self.create_oval(
+                shadow_offset, shadow_offset,
+                width - shadow_offset, height - shadow_offset,
+                fill='#000000', outline='', tags='shadow'
+            )
             
             text_color = COLORS['text_primary']
         else:
             # Inactive: dark translucent
-            bg_rgb = hex_to_rgb(COLORS['bg_panel'])
-            parent_bg = hex_to_rgb(self.master.cget('bg') if hasattr(self.master, 'cget') else COLORS['bg_primary'])
-            blended = tuple(
-                int(bg_rgb[i] * 0.8 + parent_bg[i] * 0.2)
-                for i in range(3)
-            )
-            panel_color = rgb_to_hex(blended)
+            panel_color = blend_colors(COLORS['bg_panel'], self._parent_bg, 0.8)
             
             self.create_rounded_rectangle(
                 0, 0, width, height,
@@ -366,7 +400,7 @@ class PillToggleButton(tk.Canvas):
             width // 2, height // 2,
             text=self.text,
             fill=text_color,
-            font=FONTS['default'],
+            font=get_tk_font('default', self),
             tags='text'
         )
         
@@ -376,43 +410,12 @@ class PillToggleButton(tk.Canvas):
         self.tag_raise('text')
     
     def create_rounded_rectangle(self, x1, y1, x2, y2, radius=10, **kwargs):
-        """Create a rounded rectangle using arcs and rectangles"""
-        fill = kwargs.pop('fill', '')
-        outline = kwargs.pop('outline', '')
-        width = kwargs.pop('width', 1)
-        
-        # Draw main rectangle
-        if fill:
-            self.create_rectangle(x1 + radius, y1, x2 - radius, y2, fill=fill, outline='', **kwargs)
-            self.create_rectangle(x1, y1 + radius, x2, y2 - radius, fill=fill, outline='', **kwargs)
-        # Draw corner arcs
-        if fill:
-            self.create_oval(x1, y1, x1 + radius * 2, y1 + radius * 2, fill=fill, outline='', **kwargs)
-            self.create_oval(x2 - radius * 2, y1, x2, y1 + radius * 2, fill=fill, outline='', **kwargs)
-            self.create_oval(x1, y2 - radius * 2, x1 + radius * 2, y2, fill=fill, outline='', **kwargs)
-            self.create_oval(x2 - radius * 2, y2 - radius * 2, x2, y2, fill=fill, outline='', **kwargs)
-        
-        # Draw outline
-        if outline:
-            # Top
-            self.create_line(x1 + radius, y1, x2 - radius, y1, fill=outline, width=width, **kwargs)
-            # Right
-            self.create_line(x2, y1 + radius, x2, y2 - radius, fill=outline, width=width, **kwargs)
-            # Bottom
-            self.create_line(x2 - radius, y2, x1 + radius, y2, fill=outline, width=width, **kwargs)
-            # Left
-            self.create_line(x1, y2 - radius, x1, y1 + radius, fill=outline, width=width, **kwargs)
-            # Arcs
-            self.create_arc(x1, y1, x1 + radius * 2, y1 + radius * 2, start=90, extent=90, 
-                          outline=outline, width=width, style='arc', **kwargs)
-            self.create_arc(x2 - radius * 2, y1, x2, y1 + radius * 2, start=0, extent=90,
-                          outline=outline, width=width, style='arc', **kwargs)
-            self.create_arc(x1, y2 - radius * 2, x1 + radius * 2, y2, start=180, extent=90,
-                          outline=outline, width=width, style='arc', **kwargs)
-            self.create_arc(x2 - radius * 2, y2 - radius * 2, x2, y2, start=270, extent=90,
-                          outline=outline, width=width, style='arc', **kwargs)
+        """Create a rounded rectangle as a single polygon item"""
+        return _create_rounded_rectangle(self, x1, y1, x2, y2, radius, **kwargs)
     
     def _on_click(self, event):
+        if self.cget('state') == 'disabled':
+            return
         if not self.is_active:
             self.variable.set(self.value)
             if self.command:
@@ -431,7 +434,7 @@ class NMSLabel(tk.Label):
     """NMS-inspired label with modern typography"""
     
     def __init__(self, parent, text, style='default', **kwargs):
-        font = FONTS.get(style, FONTS['default'])
+        font = get_tk_font(style, parent)
         fg = kwargs.pop('fg', COLORS['text_primary'])
         bg = kwargs.pop('bg', COLORS['bg_primary'])
         
@@ -6,12 +6,25 @@ from PySide6.QtWidgets import QPushButton, QWidget, QFrame
 from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect
 from PySide6.QtGui import (
     QPainter, QLinearGradient, QColor, QPen, QBrush, QFont,
-    QPainterPath
+    QPainterPath, QPixmap
 )
 from PySide6.QtWidgets import QGraphicsDropShadowEffect
 
 from .styles import COLORS, FONTS, SPACING, RADIUS
 
+# Theme colors parsed into QColors once, rather than from hex strings on
+# every paint. Copy one before changing it (e.g. setAlphaF); lighter()
+# already returns a new color.
+QCOLORS = {name: QColor(value) for name, value in COLORS.items() if isinstance(value, str)}
+QGRADIENTS = {
+    name: (QColor(value[0]), QColor(value[1]))
+    for name, value in COLORS.items() if isinstance(value, tuple)
+}
+
+# Translucent panel fill
+_PANEL_COLOR = QColor(COLORS['bg_panel'])
+_PANEL_COLOR.setAlphaF(COLORS['bg_panel_alpha'])
+
 
 class NMSButton(QPushButton):
     """NMS-inspired button with gradient and shadow"""
@@ -19,6 +32,7 @@ class NMSButton(QPushButton):
     def __init__(self, text, gradient_colors=None, parent=None):
         super().__init__(text, parent)
         self.gradient_colors = gradient_colors or COLORS['gradient_cyan_violet']
+        self._paint_cache = {}  # (width, height, hovered, enabled, dpr) -> QPixmap
         self._setup_button()
     
     def _setup_button(self):
@@ -26,77 +40,107 @@ class NMSButton(QPushButton):
         self.setMinimumHeight(40)
         self.setFont(QFont(FONTS['button'][0], FONTS['button'][1], QFont.Bold))
         
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(8)
-        shadow.setColor(QColor(0, 0, 0, 100))
-        shadow.setOffset(0, 3)
-        self.setGraphicsEffect(shadow)
+        # Add shadow effect (kept and adjusted on hover rather than replaced)
+        self._shadow = QGraphicsDropShadowEffect(self)
+        self._set_shadow(hovered=False)
+        self.setGraphicsEffect(self._shadow)
         
         # Hover animation
         self._hover_animation = QPropertyAnimation(self, b"geometry")
         self._hover_animation.setDuration(150)
         self._hover_animation.setEasingCurve(QEasingCurve.OutCubic)
     
+    def _set_shadow(self, hovered):
+        """Switch the shadow between its resting and hover look"""
+        self._hover_shown = hovered
+        if hovered:
+            self._shadow.setBlurRadius(12)
+            self._shadow.setColor(QColor(0, 0, 0, 150))
+            self._shadow.setOffset(0, 4)
+        else:
+            self._shadow.setBlurRadius(8)
+            self._shadow.setColor(QColor(0, 0, 0, 100))
+            self._shadow.setOffset(0, 3)
+    
     def paintEvent(self, event):
         """Custom paint with gradient"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         rect = self.rect()
+        if rect.isEmpty():
+            return
+        enabled = self.isEnabled()
+        hovered = enabled and self.underMouse()
         
-        # Create gradient (horizontal for NMS style)
-        gradient = QLinearGradient(0, 0, rect.width(), 0)
-        color1 = QColor(self.gradient_colors[0])
-        color2 = QColor(self.gradient_colors[1])
+        # The rounded gradient background only changes with size and state,
+        # so it is rasterized once per state and blitted on later paints
+        ratio = self.devicePixelRatioF()
+        key = (rect.width(), rect.height(), hovered, enabled, ratio)
+        background = self._paint_cache.get(key)
+        if background is None:
+            background = self._paint_cache[key] = self._render_background(rect, hovered, enabled, ratio)
+        painter.drawPixmap(0, 0, background)
         
-        # Brighten gradient on hover
-        if self.underMouse() and self.isEnabled():
-            color1 = color1.lighter(110)
-            color2 = color2.lighter(110)
+        # Draw text
+        painter.setPen(QPen(QCOLORS['text_primary']))
+        painter.setFont(self.font())
+        painter.drawText(rect, Qt.AlignCenter, self.text())
+    
+    def _render_background(self, rect, hovered, enabled, ratio):
+        """Rasterize the rounded button background for one state"""
+        background = QPixmap(round(rect.width() * ratio), round(rect.height() * ratio))
+        background.setDevicePixelRatio(ratio)
+        background.fill(Qt.transparent)
         
-        gradient.setColorAt(0, color1)
-        gradient.setColorAt(1, color2)
+        painter = QPainter(background)
+        painter.setRenderHint(QPainter.Antialiasing)
         
         # Draw rounded rectangle with gradient
         path = QPainterPath()
         path.addRoundedRect(rect, RADIUS['md'], RADIUS['md'])
         
-        if not self.isEnabled():
+        if not enabled:
             # Disabled state
-            painter.fillPath(path, QBrush(QColor(COLORS['bg_tertiary'])))
-            painter.setPen(QPen(QColor(COLORS['text_muted'])))
+            brush = QBrush(QCOLORS['bg_tertiary'])
         else:
-            painter.fillPath(path, QBrush(gradient))
-            painter.setPen(QPen(QColor(255, 255, 255, 0)))  # No border
+            # Create gradient (horizontal for NMS style)
+            gradient = QLinearGradient(0, 0, rect.width(), 0)
+            color1 = QColor(self.gradient_colors[0])
+            color2 = QColor(self.gradient_colors[1])
+            
+            # Brighten gradient on hover
+            if hovered:
+                color1 = color1.lighter(110)
+                color2 = color2.lighter(110)
+            
+            gradient.setColorAt(0, color1)
+            gradient.setColorAt(1, color2)
+            brush = QBrush(gradient)
         
-        # Draw text
-        painter.setPen(QPen(QColor(COLORS['text_primary'])))
-        painter.setFont(self.font())
-        painter.drawText(rect, Qt.AlignCenter, self.text())
+        painter.fillPath(path, brush)
+        painter.end()
+        return background
+    
+    def resizeEvent(self, event):
+        """Drop paint state built for the old size"""
+        self._paint_cache.clear()
+        super().resizeEvent(event)
     
     def enterEvent(self, event):
         """Hover effect"""
-        if self.isEnabled():
+        if self.isEnabled() and not self._hover_shown:
             # Brighten shadow on hover
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(12)
-            shadow.setColor(QColor(0, 0, 0, 150))
-            shadow.setOffset(0, 4)
-            self.setGraphicsEffect(shadow)
+            self._set_shadow(hovered=True)
             # Trigger repaint to show hover effect
             self.update()
         super().enterEvent(event)
     
     def leaveEvent(self, event):
         """Leave hover"""
-        if self.isEnabled():
+        if self.isEnabled() and self._hover_shown:
             # Reset shadow
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(8)
-            shadow.setColor(QColor(0, 0, 0, 100))
-            shadow.setOffset(0, 3)
-            self.setGraphicsEffect(shadow)
+            self._set_shadow(hovered=False)
             # Trigger repaint
             self.update()
         super().leaveEvent(event)
@@ -121,9 +165,8 @@ class NMSPanel(QFrame):
         
         rect = self.rect()
         
-        # Create semi-transparent background
-        bg_color = QColor(COLORS['bg_panel'])
-        bg_color.setAlphaF(COLORS['bg_panel_alpha'])
+        # Semi-transparent background
+        bg_color = _PANEL_COLOR
         
         # Draw rounded rectangle
         path = QPainterPath()
@@ -132,7 +175,7 @@ class NMSPanel(QFrame):
         painter.fillPath(path, QBrush(bg_color))
         
         # Draw border
-        pen = QPen(QColor(COLORS['border']))
+        pen = QPen(QCOLORS['border'])
         pen.setWidth(1)
         painter.setPen(pen)
         painter.drawPath(path)
@@ -148,26 +191,43 @@ class PillToggleButton(QPushButton):
         self.setMinimumHeight(36)
         self.setFont(QFont(FONTS['default'][0], FONTS['default'][1]))
         self._is_hovered = False
+        self._paint_cache = {}  # (width, height, checked, hovered, dpr) -> (QPixmap, text pen)
         self._setup_toggle()
     
     def _setup_toggle(self):
         """Setup toggle styling"""
-        # Add shadow for active state
-        self._shadow = QGraphicsDropShadowEffect()
+        # Add shadow for active state. The effect stays installed and is
+        # switched on and off with the checked state, instead of being
+        # set and cleared from paintEvent (clearing it deletes the effect)
+        self._shadow = QGraphicsDropShadowEffect(self)
         self._shadow.setBlurRadius(4)
         self._shadow.setColor(QColor(0, 0, 0, 80))
         self._shadow.setOffset(0, 2)
+        self._shadow.setEnabled(self.isChecked())
+        self.setGraphicsEffect(self._shadow)
+        self.toggled.connect(self._shadow.setEnabled)
+    
+    def resizeEvent(self, event):
+        """Drop paint state built for the old size"""
+        self._paint_cache.clear()
+        super().resizeEvent(event)
+    
+    def _set_hovered(self, hovered):
+        """Record the hover state, repainting only when it flips"""
+        # Enter/Leave can repeat without the pointer really crossing (e.g.
+        # around popups and mouse grabs); those don't change the look
+        if hovered != self._is_hovered:
+            self._is_hovered = hovered
+            self.update()  # Trigger repaint
     
     def enterEvent(self, event):
         """Hover enter"""
-        self._is_hovered = True
-        self.update()  # Trigger repaint
+        self._set_hovered(True)
         super().enterEvent(event)
     
     def leaveEvent(self, event):
         """Hover leave"""
-        self._is_hovered = False
-        self.update()  # Trigger repaint
+        self._set_hovered(False)
         super().leaveEvent(event)
     
     def paintEvent(self, event):
@@ -176,45 +236,68 @@ class PillToggleButton(QPushButton):
         painter.setRenderHint(QPainter.Antialiasing)
         
         rect = self.rect()
+        if rect.isEmpty():
+            return
+        checked = self.isChecked()
+        hovered = self._is_hovered
+        
+        # The pill background is rasterized once per size and state, so
+        # stray repaints (overlapping siblings, parent resizes) only blit it
+        ratio = self.devicePixelRatioF()
+        key = (rect.width(), rect.height(), checked, hovered, ratio)
+        cached = self._paint_cache.get(key)
+        if cached is None:
+            cached = self._paint_cache[key] = self._render_background(rect, checked, hovered, ratio)
+        background, text_pen = cached
+        painter.drawPixmap(0, 0, background)
+        
+        # Draw text
+        painter.setPen(text_pen)
+        painter.setFont(self.font())
+        painter.drawText(rect, Qt.AlignCenter, self.text())
+    
+    def _render_background(self, rect, checked, hovered, ratio):
+        """Rasterize the pill for one state; returns it with the text pen"""
+        background = QPixmap(round(rect.width() * ratio), round(rect.height() * ratio))
+        background.setDevicePixelRatio(ratio)
+        background.fill(Qt.transparent)
+        
+        painter = QPainter(background)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
         path = QPainterPath()
         path.addRoundedRect(rect, RADIUS['pill'], RADIUS['pill'])
         
-        if self.isChecked():
+        if checked:
             # Active: gradient background
             gradient = QLinearGradient(0, 0, rect.width(), 0)
-            color1 = QColor(COLORS['gradient_active'][0])
-            color2 = QColor(COLORS['gradient_active'][1])
+            color1, color2 = QGRADIENTS['gradient_active']
             # Brighten on hover
-            if self._is_hovered:
+            if hovered:
                 color1 = color1.lighter(110)
                 color2 = color2.lighter(110)
             gradient.setColorAt(0, color1)
             gradient.setColorAt(1, color2)
             painter.fillPath(path, QBrush(gradient))
-            self.setGraphicsEffect(self._shadow)
-            text_color = QColor(COLORS['text_primary'])
+            text_color = QCOLORS['text_primary']
         else:
             # Inactive: translucent background
-            bg_color = QColor(COLORS['bg_panel'])
-            if self._is_hovered:
+            bg_color = QColor(QCOLORS['bg_panel'])
+            if hovered:
                 # Brighten on hover
                 bg_color.setAlphaF(0.8)
             else:
                 bg_color.setAlphaF(0.6)
             painter.fillPath(path, QBrush(bg_color))
-            self.setGraphicsEffect(None)
             
             # Border - highlight on hover
-            border_color = COLORS['border_cyan'] if self._is_hovered else COLORS['border']
-            pen = QPen(QColor(border_color))
-            pen.setWidth(1 if not self._is_hovered else 2)
-            painter.setPen(pen)
+            border_color = QCOLORS['border_cyan'] if hovered else QCOLORS['border']
+            border_pen = QPen(border_color)
+            border_pen.setWidth(1 if not hovered else 2)
+            painter.setPen(border_pen)
             painter.drawPath(path)
             
-            text_color = QColor(COLORS['text_primary'] if self._is_hovered else COLORS['text_secondary'])
+            text_color = QCOLORS['text_primary'] if hovered else QCOLORS['text_secondary']
         
-        # Draw text
-        painter.setPen(QPen(text_color))
-        painter.setFont(self.font())
-        painter.drawText(rect, Qt.AlignCenter, self.text())
-
+        painter.end()
+        return background, QPen(text_color)
@@ -2,12 +2,80 @@
 Custom dropdown with visible chevron indicator
 """
 
-from PySide6.QtWidgets import QComboBox
+from PySide6.QtWidgets import QApplication, QComboBox
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QPolygonF
+from PySide6.QtGui import QPainter, QPen, QBrush, QPolygonF, QPixmap
 from PySide6.QtCore import QPointF
 
 from .styles import COLORS, RADIUS
+from .qt_components import QCOLORS
+
+# Chevron pixmap edge length and triangle size, in logical pixels
+CHEVRON_PIXMAP_SIZE = 16
+CHEVRON_SIZE = 8
+
+
+def _render_chevron(color, device_pixel_ratio):
+    """Rasterize the downward chevron, centered in a small transparent pixmap"""
+    scale = CHEVRON_PIXMAP_SIZE * device_pixel_ratio
+    pixmap = QPixmap(round(scale), round(scale))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QBrush(color))
+    
+    # Create triangle points
+    center = CHEVRON_PIXMAP_SIZE / 2
+    painter.drawPolygon(QPolygonF([
+        QPointF(center - CHEVRON_SIZE / 2, center - CHEVRON_SIZE / 3),
+        QPointF(center + CHEVRON_SIZE / 2, center - CHEVRON_SIZE / 3),
+        QPointF(center, center + CHEVRON_SIZE / 3)
+    ]))
+    painter.end()
+    return pixmap
+
+
+# Dropdown look, installed once on the application rather than parsed
+# into a style sheet per widget. Rules match combo boxes tagged with the
+# NMSDropdown class property.
+NMS_DROPDOWN_QSS = f"""
+    QComboBox[class="NMSDropdown"] {{
+        background-color: {COLORS['bg_panel']};
+        color: {COLORS['text_primary']};
+        border: 2px solid {COLORS['border']};
+        border-radius: {RADIUS['md']}px;
+        padding: 8px 32px 8px 8px;
+        font-size: 11px;
+    }}
+    QComboBox[class="NMSDropdown"]:hover {{
+        border-color: {COLORS['border_cyan']};
+    }}
+    QComboBox[class="NMSDropdown"]:focus {{
+        border-color: {COLORS['border_focus']};
+    }}
+    QComboBox[class="NMSDropdown"]::drop-down {{
+        border: none;
+        width: 24px;
+        background-color: transparent;
+    }}
+    QComboBox[class="NMSDropdown"] QAbstractItemView {{
+        background-color: {COLORS['bg_panel']};
+        color: {COLORS['text_primary']};
+        selection-background-color: {COLORS['selection']};
+        border: 1px solid {COLORS['border']};
+        border-radius: {RADIUS['md']}px;
+        padding: 4px;
+    }}
+"""
+
+
+def install_nms_styles(app):
+    """Add the NMS dropdown rules to the application style sheet (once)"""
+    if app is not None and NMS_DROPDOWN_QSS not in app.styleSheet():
+        app.setStyleSheet(app.styleSheet() + NMS_DROPDOWN_QSS)
 
 
 class DropdownComboBox(QComboBox):
@@ -15,35 +83,12 @@ class DropdownComboBox(QComboBox):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {COLORS['bg_panel']};
-                color: {COLORS['text_primary']};
-                border: 2px solid {COLORS['border']};
-                border-radius: {RADIUS['md']}px;
-                padding: 8px 32px 8px 8px;
-                font-size: 11px;
-            }}
-            QComboBox:hover {{
-                border-color: {COLORS['border_cyan']};
-            }}
-            QComboBox:focus {{
-                border-color: {COLORS['border_focus']};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 24px;
-                background-color: transparent;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {COLORS['bg_panel']};
-                color: {COLORS['text_primary']};
-                selection-background-color: {COLORS['selection']};
-                border: 1px solid {COLORS['border']};
-                border-radius: {RADIUS['md']}px;
-                padding: 4px;
-            }}
-        """)
+        # Rendered chevrons by (highlighted, device pixel ratio)
+        self._chevrons = {}
+        
+        # Styled by the app-wide NMS_DROPDOWN_QSS rules
+        self.setProperty("class", "NMSDropdown")
+        install_nms_styles(QApplication.instance())
     
     def paintEvent(self, event):
         """Custom paint with chevron indicator"""
@@ -51,29 +96,19 @@ class DropdownComboBox(QComboBox):
         
         # Draw chevron indicator
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         
         # Position chevron on the right side
-        width = self.width()
-        height = self.height()
-        chevron_size = 8
-        chevron_x = width - 20
-        chevron_y = height / 2
+        chevron_x = self.width() - 20
+        chevron_y = self.height() / 2
         
-        # Draw downward triangle (chevron)
-        chevron_color = QColor(COLORS['text_secondary'])
-        if self.underMouse() or self.hasFocus():
-            chevron_color = QColor(COLORS['accent_cyan'])
+        # Blit a pre-rendered downward triangle rather than building and
+        # filling the polygon on every paint
+        highlighted = self.underMouse() or self.hasFocus()
+        ratio = self.devicePixelRatioF()
+        chevron = self._chevrons.get((highlighted, ratio))
+        if chevron is None:
+            color = QCOLORS['accent_cyan'] if highlighted else QCOLORS['text_secondary']
+            chevron = self._chevrons[(highlighted, ratio)] = _render_chevron(color, ratio)
         
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(chevron_color))
-        
-        # Create triangle points
-        points = QPolygonF([
-            QPointF(chevron_x - chevron_size/2, chevron_y - chevron_size/3),
-            QPointF(chevron_x + chevron_size/2, chevron_y - chevron_size/3),
-            QPointF(chevron_x, chevron_y + chevron_size/3)
-        ])
-        
-        painter.drawPolygon(points)
-
+        offset = CHEVRON_PIXMAP_SIZE / 2
+        painter.drawPixmap(QPointF(chevron_x - offset, chevron_y - offset), chevron)
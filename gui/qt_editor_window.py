@@ -3,17 +3,98 @@ Base editor window for PySide6
 """
 
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QMessageBox, QFrame
+    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+    QPlainTextEdit, QMessageBox
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QTextCursor
 
 from .styles import COLORS, FONTS, SPACING, RADIUS
 from .qt_components import NMSButton, NMSPanel
-from save_editor import SaveEditor
+from .qt_worker import ParseBaseWorker
 import json
 
+# Faster JSON parsing/serialization (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj):
+    """Serialize a base for display (2-space indent, non-ASCII kept as is)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _loads(text):
+    """Parse editor text; errors are json.JSONDecodeError either way"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which json accepts
+            pass
+    return json.loads(text)
+
+
+# (base object, its serialized JSON) from the last editor opened
+_json_cache = (None, None)
+
+# Characters inserted per event loop pass when loading large JSON
+_LOAD_CHUNK_CHARS = 64 * 1024
+
+# Edited documents at least this long are parsed for the part count on a
+# worker thread instead of blocking the editor
+_BACKGROUND_COUNT_CHARS = 1024 * 1024
+
+# Style sheets, built once at import rather than per dialog
+_DIALOG_QSS = f"""
+    QDialog {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {COLORS['bg_primary']}, stop:1 {COLORS['bg_primary_end']});
+    }}
+"""
+
+_TITLE_QSS = f"""
+    QLabel {{
+        color: {COLORS['text_primary']};
+        font-size: {FONTS['heading'][1]}px;
+        font-weight: bold;
+    }}
+"""
+
+_INFO_QSS = f"""
+    QLabel {{
+        color: {COLORS['text_cyan']};
+        font-size: {FONTS['small'][1]}px;
+    }}
+"""
+
+_PART_COUNT_QSS = f"""
+    QLabel {{
+        color: {COLORS['text_primary']};
+        font-size: {FONTS['default'][1]}px;
+        font-weight: bold;
+    }}
+"""
+
+_EDITOR_QSS = f"""
+    QPlainTextEdit {{
+        background-color: {COLORS['bg_tertiary']};
+        color: {COLORS['text_primary']};
+        border: 2px solid {COLORS['border']};
+        border-radius: {RADIUS['md']}px;
+        font-family: {FONTS['monospace'][0]};
+        font-size: {FONTS['monospace'][1]}px;
+        padding: 8px;
+    }}
+    QPlainTextEdit:focus {{
+        border-color: {COLORS['border_focus']};
+    }}
+"""
+
 
 class EditorWindow(QDialog):
     """Base editor window"""
@@ -23,17 +104,39 @@ class EditorWindow(QDialog):
         self.save_editor = save_editor
         self.on_save_callback = on_save_callback
         self.is_editing = False
+        self.parse_worker = None
+        self.count_worker = None
         
         self.setWindowTitle("Base Editor")
         self.setGeometry(100, 100, 900, 700)
         
-        # Get base data
-        self.base_data = self.save_editor.selected_base.copy()
-        self.original_json = json.dumps(self.base_data, indent=2, ensure_ascii=False)
+        # Get base data; read only here (saving replaces it), so no copy
+        self.base_data = self.save_editor.selected_base
+        # Serialized on first use by the original_json property
+        self._original_json = None
+        # Hash of the text the part count label currently reflects
+        self._part_count_key = None
         
         self._create_ui()
         self._load_base_data()
     
+    @property
+    def original_json(self):
+        """JSON text of the base, serialized on first use and kept"""
+        global _json_cache
+        
+        if self._original_json is None:
+            # Bases are replaced rather than edited in place, so the same
+            # selected_base object always serializes to the same text
+            source = self.save_editor.selected_base
+            cached_base, cached_json = _json_cache
+            if cached_base is source:
+                self._original_json = cached_json
+            else:
+                self._original_json = _dumps(self.base_data)
+                _json_cache = (source, self._original_json)
+        return self._original_json
+    
     def _create_ui(self):
         """Create UI"""
         layout = QVBoxLayout(self)
@@ -41,25 +144,14 @@ class EditorWindow(QDialog):
         layout.setContentsMargins(SPACING['xl'], SPACING['xl'], SPACING['xl'], SPACING['xl'])
         
         # Set background
-        self.setStyleSheet(f"""
-            QDialog {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {COLORS['bg_primary']}, stop:1 {COLORS['bg_primary_end']});
-            }}
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
         
         # Header
         header_layout = QHBoxLayout()
         
         base_name = self.base_data.get("Name", "Unknown")
         title = QLabel(f"Editing: {base_name} ◆")
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['text_primary']};
-                font-size: {FONTS['heading'][1]}px;
-                font-weight: bold;
-            }}
-        """)
+        title.setStyleSheet(_TITLE_QSS)
         header_layout.addWidget(title)
         header_layout.addStretch()
         
@@ -88,12 +180,7 @@ class EditorWindow(QDialog):
             "💡 Tip: You can export JSON from djmonkeyuk's base editor using 'Export to NMS' option, "
             "then paste it here after clicking Edit."
         )
-        info_text.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['text_cyan']};
-                font-size: {FONTS['small'][1]}px;
-            }}
-        """)
+        info_text.setStyleSheet(_INFO_QSS)
         info_text.setWordWrap(True)
         info_layout.addWidget(info_text)
         
@@ -102,13 +189,7 @@ class EditorWindow(QDialog):
         # Part count display
         part_count_layout = QHBoxLayout()
         self.part_count_label = QLabel()
-        self.part_count_label.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['text_primary']};
-                font-size: {FONTS['default'][1]}px;
-                font-weight: bold;
-            }}
-        """)
+        self.part_count_label.setStyleSheet(_PART_COUNT_QSS)
         part_count_layout.addWidget(self.part_count_label)
         part_count_layout.addStretch()
         layout.addLayout(part_count_layout)
@@ -118,26 +199,28 @@ class EditorWindow(QDialog):
         editor_layout = QVBoxLayout(editor_panel)
         editor_layout.setContentsMargins(SPACING['md'], SPACING['md'], SPACING['md'], SPACING['md'])
         
-        self.json_text = QTextEdit()
-        self.json_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {COLORS['bg_tertiary']};
-                color: {COLORS['text_primary']};
-                border: 2px solid {COLORS['border']};
-                border-radius: {RADIUS['md']}px;
-                font-family: {FONTS['monospace'][0]};
-                font-size: {FONTS['monospace'][1]}px;
-                padding: 8px;
-            }}
-            QTextEdit:focus {{
-                border-color: {COLORS['border_focus']};
-            }}
-        """)
+        # Plain text widget: line-based layout, only visible lines are laid out
+        self.json_text = QPlainTextEdit()
+        self.json_text.setStyleSheet(_EDITOR_QSS)
+        self.json_text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.json_text.setCenterOnScroll(True)
         self.json_text.setReadOnly(True)
-        # Connect text changed signal to update part count
-        self.json_text.textChanged.connect(self._update_part_count)
+        
+        # Recount parts once typing pauses rather than reparsing the whole
+        # document on every keystroke; each change restarts the timer
+        self._part_count_timer = QTimer(self)
+        self._part_count_timer.setSingleShot(True)
+        self._part_count_timer.setInterval(250)
+        self._part_count_timer.timeout.connect(self._update_part_count)
+        self.json_text.textChanged.connect(self._part_count_timer.start)
         editor_layout.addWidget(self.json_text)
         
+        # Appends the JSON a chunk per event loop pass while loading
+        self._load_pos = 0
+        self._load_timer = QTimer(self)
+        self._load_timer.setInterval(0)
+        self._load_timer.timeout.connect(self._insert_next_chunk)
+        
         layout.addWidget(editor_panel, 1)
         
         # Close button
@@ -147,63 +230,152 @@ class EditorWindow(QDialog):
     
     def _load_base_data(self):
         """Load base data into editor"""
-        self.json_text.setPlainText(self.original_json)
+        # Leave the text alone if it already shows this JSON (e.g. after a save)
+        if self.json_text.toPlainText() == self.original_json:
+            self._update_part_count()
+            return
+        
+        self._load_timer.stop()
+        self.json_text.clear()
+        # Loading isn't an edit the user should be able to undo
+        self.json_text.document().setUndoRedoEnabled(False)
+        
+        # Keep the partial text from being copied or edited until it's all in
+        self.copy_btn.setEnabled(False)
+        self.edit_btn.setEnabled(False)
+        self._load_pos = 0
+        self._load_timer.start()
+    
+    def _insert_next_chunk(self):
+        """Append the next chunk of original_json to the editor"""
+        text = self.original_json
+        start = self._load_pos
+        
+        # Break on a line boundary so each insert ends with whole lines
+        end = text.find('\n', start + _LOAD_CHUNK_CHARS)
+        end = len(text) if end == -1 else end + 1
+        
+        cursor = QTextCursor(self.json_text.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text[start:end])
+        self._load_pos = end
+        
+        if end < len(text):
+            return
+        
+        self._load_timer.stop()
+        self.json_text.document().setUndoRedoEnabled(True)
+        self.copy_btn.setEnabled(True)
+        self.edit_btn.setEnabled(True)
+        
+        # Count right away; the changes queued while inserting are redundant
+        self._part_count_timer.stop()
         self._update_part_count()
     
     def _update_part_count(self):
         """Update the part count display based on current JSON content"""
+        # Text still being loaded is incomplete; it's counted once it's all in
+        if self._load_timer.isActive():
+            return
+        
+        # One background count at a time; check again once it has reported
+        if self.count_worker is not None:
+            self._part_count_timer.start()
+            return
+        
+        json_str = self.json_text.toPlainText().strip()
+        
+        # Nothing to do if the label already reflects this exact text
+        key = hash(json_str)
+        if key == self._part_count_key:
+            return
+        self._part_count_key = key
+        
+        if not json_str:
+            self.part_count_label.setText("Number of parts: 0")
+            return
+        
+        # Unedited text needs no parse; the data it was dumped from is at
+        # hand (compared against a dump already made, never a fresh one)
+        if json_str == self._original_json:
+            self._show_part_count(True, self.base_data)
+            return
+        
+        # Large documents (e.g. a pasted base) are parsed off the GUI thread
+        if self.json_text.document().characterCount() >= _BACKGROUND_COUNT_CHARS:
+            self.part_count_label.setText("Number of parts: counting...")
+            self.count_worker = ParseBaseWorker(json_str, _loads)
+            self.count_worker.finished.connect(self._on_count_parsed)
+            self.count_worker.start()
+            return
+        
         try:
-            json_str = self.json_text.toPlainText().strip()
-            if not json_str:
-                self.part_count_label.setText("Number of parts: 0")
+            base_data = _loads(json_str)
+        except Exception:
+            self._show_part_count(False, None)
+        else:
+            self._show_part_count(True, base_data)
+    
+    def _on_count_parsed(self, success, base_data, message):
+        """Show the part count once a background parse has finished"""
+        self.count_worker = None
+        self._show_part_count(success, base_data)
+    
+    def _show_part_count(self, success, base_data):
+        """Set the part count label from parsed base data (success=False if unparsable)"""
+        if success:
+            try:
+                count = self._count_objects(base_data)
+                self.part_count_label.setText(f"Number of parts: {count}")
                 return
-            
-            # Try to parse the JSON
-            base_data = json.loads(json_str)
-            
-            # Count objects using the same logic as get_selected_base_component_count
-            count = 0
-            if "Objects" in base_data:
-                objects = base_data["Objects"]
-                if isinstance(objects, list):
-                    count = len(objects)
+            except Exception:
+                pass
+        
+        # If JSON is invalid or incomplete, try to show last known count or 0
+        try:
+            # Fallback: try to get count from save_editor if available
+            if self.save_editor.selected_base is not None:
+                count = self.save_editor.get_selected_base_component_count()
+                self.part_count_label.setText(f"Number of parts: {count} (invalid JSON)")
             else:
-                # Use recursive search if Objects is nested
-                from utils import find_key_recursively
-                objects_keys = list(find_key_recursively(base_data, "Objects"))
-                if objects_keys:
-                    path, objects_value = objects_keys[0]
-                    if isinstance(objects_value, list):
-                        count = len(objects_value)
-            
-            self.part_count_label.setText(f"Number of parts: {count}")
-        except (json.JSONDecodeError, Exception):
-            # If JSON is invalid or incomplete, try to show last known count or 0
-            try:
-                # Fallback: try to get count from save_editor if available
-                if self.save_editor.selected_base is not None:
-                    count = self.save_editor.get_selected_base_component_count()
-                    self.part_count_label.setText(f"Number of parts: {count} (invalid JSON)")
-                else:
-                    self.part_count_label.setText("Number of parts: ? (invalid JSON)")
-            except:
                 self.part_count_label.setText("Number of parts: ? (invalid JSON)")
+        except:
+            self.part_count_label.setText("Number of parts: ? (invalid JSON)")
+    
+    @staticmethod
+    def _count_objects(base_data):
+        """Count objects using the same logic as get_selected_base_component_count"""
+        if "Objects" in base_data:
+            objects = base_data["Objects"]
+            return len(objects) if isinstance(objects, list) else 0
+        
+        # Use recursive search if Objects is nested
+        from utils import find_key_recursively
+        first = next(find_key_recursively(base_data, "Objects"), None)
+        if first is not None:
+            path, objects_value = first
+            if isinstance(objects_value, list):
+                return len(objects_value)
+        return 0
     
     def _copy_json(self):
         """Copy JSON to clipboard"""
-        from PySide6.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.json_text.toPlainText())
-        
         # Visual feedback
         original_text = self.copy_btn.text()
         self.copy_btn.setText("✓ Copied!")
         self.copy_btn.setEnabled(False)
-        from PySide6.QtCore import QTimer
         QTimer.singleShot(2000, lambda: (
             self.copy_btn.setText(original_text),
             self.copy_btn.setEnabled(True)
         ))
+        
+        # Set the clipboard on the next event loop pass so the feedback is
+        # painted before a slow clipboard round-trip (X11/Wayland) blocks
+        QTimer.singleShot(0, self._set_clipboard)
+    
+    def _set_clipboard(self):
+        """Put the editor's JSON on the system clipboard"""
+        QApplication.clipboard().setText(self.json_text.toPlainText())
     
     def _toggle_edit(self):
         """Toggle edit mode"""
@@ -219,16 +391,35 @@ class EditorWindow(QDialog):
             self.is_editing = False
     
     def _save_base(self):
-        """Save the edited base"""
-        if not self.is_editing:
+        """Validate the edited base off the GUI thread, then save it"""
+        if not self.is_editing or self.parse_worker is not None:
             return
         
         json_str = self.json_text.toPlainText().strip()
         
-        try:
-            new_base_data = json.loads(json_str)
-        except json.JSONDecodeError as e:
-            QMessageBox.critical(self, "Invalid JSON", f"The JSON is invalid:\n{e}")
+        # Freeze the editor while the text is parsed so what gets saved is
+        # what is on screen
+        self.json_text.setReadOnly(True)
+        self.edit_btn.setEnabled(False)
+        self.save_btn.setEnabled(False)
+        
+        # Create and start worker thread
+        self.parse_worker = ParseBaseWorker(json_str, _loads)
+        self.parse_worker.finished.connect(self._on_parse_finished)
+        self.parse_worker.start()
+    
+    def _on_parse_finished(self, success, new_base_data, message):
+        """Confirm and save once the edited JSON has been parsed"""
+        global _json_cache
+        
+        json_str = self.parse_worker.json_text
+        self.parse_worker = None
+        self.json_text.setReadOnly(False)
+        self.edit_btn.setEnabled(True)
+        self.save_btn.setEnabled(True)
+        
+        if not success:
+            QMessageBox.critical(self, "Invalid JSON", f"The JSON is invalid:\n{message}")
             return
         
         reply = QMessageBox.question(
@@ -244,12 +435,14 @@ class EditorWindow(QDialog):
             return
         
         try:
+            # The editor already shows the saved text, so it isn't reloaded and
+            # no second copy of it is kept; original_json re-dumps if needed
             self.base_data = new_base_data
-            self.original_json = json_str
+            self._original_json = None
             self.save_editor.selected_base = new_base_data
+            _json_cache = (None, None)
             self.save_editor.save_selected_base_to_json()
             
-            self._load_base_data()
             self._toggle_edit()
             
             if self.on_save_callback:
@@ -258,4 +451,17 @@ class EditorWindow(QDialog):
             QMessageBox.information(self, "Success", "Base saved successfully!")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save base:\n{e}")
-
+    
+    def done(self, result):
+        """Close the dialog, first letting any running parse finish"""
+        self._load_timer.stop()
+        self._part_count_timer.stop()
+        if self.parse_worker is not None:
+            self.parse_worker.finished.disconnect(self._on_parse_finished)
+            self.parse_worker.wait()
+            self.parse_worker = None
+        if self.count_worker is not None:
+            self.count_worker.finished.disconnect(self._on_count_parsed)
+            self.count_worker.wait()
+            self.count_worker = None
+        super().done(result)
@@ -4,6 +4,7 @@ PySide6 implementation with NMS-Inspired Explorer theme
 """
 
 import sys
+from operator import itemgetter
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QComboBox, QListWidget, QMessageBox,
@@ -116,6 +117,7 @@ class MainWindow(QMainWindow):
         self.worker = None  # Background worker thread
         self.inject_worker = None  # Background worker for injection
         self.count_worker = None  # Background worker for counting components
+        self._dropdown_files = []  # Save file names in dropdown order
         
         # Load save files
         try:
@@ -518,26 +520,33 @@ class MainWindow(QMainWindow):
         if not self.save_editor.save_files:
             return
         
-        sorted_files = sorted(
-            self.save_editor.save_files,
-            key=lambda x: self.save_editor.get_save_file_metadata(x).get('last_saved', ''),
-            reverse=True
-        )
+        # Look each file's metadata up once for both the sort and the labels
+        metadata = {
+            save_file: self.save_editor.get_save_file_metadata(save_file)
+            for save_file in self.save_editor.save_files
+        }
+        
+        # Sort by last modified time (descending), keyed with a C itemgetter
+        # over (file, last saved) pairs rather than a lambda
+        pairs = [(save_file, metadata[save_file].get('last_saved', '')) for save_file in metadata]
+        pairs.sort(key=itemgetter(1), reverse=True)
+        sorted_files = [save_file for save_file, _ in pairs]
         
+        self._dropdown_files = sorted_files
         self.save_file_dropdown.clear()
-        for save_file in sorted_files:
-            metadata = self.save_editor.get_save_file_metadata(save_file)
-            last_saved = metadata.get('last_saved', 'Unknown')
-            self.save_file_dropdown.addItem(f"{save_file} - {last_saved}")
+        self.save_file_dropdown.addItems([
+            f"{save_file} - {metadata[save_file].get('last_saved', 'Unknown')}"
+            for save_file in sorted_files
+        ])
     
     def _load_save_file(self):
         """Load and decompress save file in background thread"""
-        selection = self.save_file_dropdown.currentText()
-        if not selection:
+        index = self.save_file_dropdown.currentIndex()
+        if index < 0:
             QMessageBox.warning(self, "Warning", "Please select a save file first.")
             return
         
-        save_file_name = selection.split(' - ')[0]
+        save_file_name = self._dropdown_files[index]
         
         # Disable buttons during loading
         self.load_file_btn.setEnabled(False)
@@ -693,8 +702,8 @@ class MainWindow(QMainWindow):
         save_file_name = "save file"
         if hasattr(self.save_editor, 'selected_save_file') and self.save_editor.selected_save_file:
             save_file_name = self.save_editor.selected_save_file.replace('.hg', '')
-        elif hasattr(self, 'save_file_dropdown') and self.save_file_dropdown.currentText():
-            save_file_name = self.save_file_dropdown.currentText().split(' - ')[0].replace('.hg', '')
+        elif hasattr(self, 'save_file_dropdown') and self.save_file_dropdown.currentIndex() >= 0:
+            save_file_name = self._dropdown_files[self.save_file_dropdown.currentIndex()].replace('.hg', '')
         
         # Add rows to table
         for i, base in enumerate(self.filtered_bases):
@@ -75,4 +75,22 @@ class CountComponentsWorker(QThread):
             total_components = self.save_editor.get_num_components_save_file_owner()
             self.finished.emit(True, total_components, f"Total components: {total_components}")
         except Exception as e:
-            self.finished.emit(False, 0, str(e))
\ No newline at end of file
+            self.finished.emit(False, 0, str(e))
+
+
+class ParseBaseWorker(QThread):
+    """Worker thread for parsing edited base JSON"""
+    
+    finished = Signal(bool, object, str)  # success, parsed base, message
+    
+    def __init__(self, json_text, loads):
+        super().__init__()
+        self.json_text = json_text
+        self.loads = loads
+    
+    def run(self):
+        """Run JSON parsing in background"""
+        try:
+            self.finished.emit(True, self.loads(self.json_text), "")
+        except Exception as e:
+            self.finished.emit(False, None, str(e))
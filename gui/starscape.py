@@ -5,11 +5,13 @@ Starscape texture generator for NMS-inspired background
 import random
 import tkinter as tk
 
+from .gradient import hex_to_rgb, gradient_strip
+
 
 class StarscapeCanvas(tk.Canvas):
     """Canvas with starscape texture overlay"""
     
-    def __init__(self, parent, star_count=100, **kwargs):
+    def __init__(self, parent, star_count=100, gradient_colors=None, **kwargs):
         # Get bg from kwargs or use parent's bg or default
         bg = kwargs.pop('bg', None)
         if bg is None or bg == '':
@@ -22,21 +24,49 @@ class StarscapeCanvas(tk.Canvas):
         super().__init__(parent, highlightthickness=0, bg=bg, **kwargs)
         self.star_count = star_count
         self.stars = []
-        self.bind('<Configure>', self._draw_stars)
-        # Draw initial stars after a short delay to ensure canvas is sized
-        self.after(100, self._draw_stars)
+        
+        # Background is either a vertical gradient or the flat bg color
+        if gradient_colors:
+            self._top_rgb = hex_to_rgb(gradient_colors[0])
+            self._bottom_rgb = hex_to_rgb(gradient_colors[1])
+        else:
+            # winfo_rgb gives 16 bit channels
+            self._top_rgb = self._bottom_rgb = tuple(c >> 8 for c in self.winfo_rgb(bg))
+        
+        # Rendered background image (kept referenced so Tk doesn't drop it)
+        self._image = None
+        self._last_size = (0, 0)
+        self._render_job = None
+        
+        self.bind('<Configure>', self._schedule_render)
     
-    def _draw_stars(self, event=None):
-        """Draw starscape texture"""
-        self.delete('stars')
+    def _schedule_render(self, event=None):
+        """Re-render 100ms after the last resize rather than on every step"""
+        if event is not None and (event.width, event.height) == self._last_size:
+            return
+        if self._render_job is not None:
+            self.after_cancel(self._render_job)
+        self._render_job = self.after(100, self._draw_stars)
+    
+    def _draw_stars(self, event=None, force=False):
+        """Draw the background gradient and starscape texture as one image"""
+        self._render_job = None
         
         width = self.winfo_width()
         height = self.winfo_height()
         
         if width <= 1 or height <= 1:
             # Retry if canvas not ready
-            self.after(50, self._draw_stars)
+            self._render_job = self.after(50, self._draw_stars)
+            return
+        
+        if (width, height) == self._last_size and not force:
             return
+        self._last_size = (width, height)
+        
+        # Gradient rows: repeat each row's color across the width in C
+        rows = gradient_strip(self._top_rgb, self._bottom_rgb, height)
+        pixels = bytearray(b''.join(rows[i:i + 3] * width for i in range(0, height * 3, 3)))
         
         # Draw stars with varying brightness and occasional cyan tint
         for _ in range(self.star_count):
@@ -50,24 +80,34 @@ class StarscapeCanvas(tk.Canvas):
             
             if use_cyan:
                 # Cyan-tinted stars
-                r = int(0 * brightness)
-                g = int(245 * brightness)
-                b = int(212 * brightness)
+                color = bytes((int(0 * brightness), int(245 * brightness), int(212 * brightness)))
             else:
                 # White stars
-                r = g = b = int(255 * brightness)
-            
-            color = f'#{r:02x}{g:02x}{b:02x}'
+                color = bytes((int(255 * brightness),)) * 3
             
             if size == 1:
-                self.create_oval(x, y, x + size, y + size, fill=color, outline='', tags='stars')
+                points = ((x, y),)
             else:
-                self.create_oval(x - 1, y - 1, x + size, y + size, fill=color, outline='', tags='stars')
+                # Small round star: the pixel plus its four neighbours
+                points = ((x, y), (x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+            
+            for px, py in points:
+                if 0 <= px < width and 0 <= py < height:
+                    offset = (py * width + px) * 3
+                    pixels[offset:offset + 3] = color
+        
+        # Hand Tk the whole background as one binary PPM buffer instead of
+        # one canvas item per star
+        header = b'P6 %d %d 255\n' % (width, height)
+        image = tk.PhotoImage(master=self, data=header + bytes(pixels), format='PPM')
+        
+        self.delete('stars')
+        self.create_image(0, 0, image=image, anchor='nw', tags='stars')
+        self._image = image
         
         # Lower stars layer
         self.tag_lower('stars')
     
     def regenerate_stars(self):
         """Regenerate starscape"""
-        self._draw_stars()
-
+        self._draw_stars(force=True)
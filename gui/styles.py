@@ -66,6 +66,33 @@ FONTS = {
     'button': ('Segoe UI', 11, 'bold'),
 }
 
+def get_tk_font(style, master=None):
+    """
+    Get a shared tkinter Font for a FONTS style (falls back to 'default').
+    
+    Tk only has to resolve each font once; widgets given the same Font object
+    reuse it instead of parsing the tuple again. A Font belongs to the Tk
+    interpreter it was made in, so the fonts are cached on the root window
+    of master (or the default root) and go away with it.
+    """
+    import tkinter
+    import tkinter.font
+    
+    if style not in FONTS:
+        style = 'default'
+    root = master._root() if master is not None else tkinter._default_root
+    if root is None:
+        return tkinter.font.Font(font=FONTS[style])
+    
+    fonts = getattr(root, '_nms_fonts', None)
+    if fonts is None:
+        fonts = root._nms_fonts = {}
+    font = fonts.get(style)
+    if font is None:
+        font = fonts[style] = tkinter.font.Font(root=root, font=FONTS[style])
+    return font
+
+
 # Spacing - NMS-inspired generous spacing
 SPACING = {
     'xs': 4,
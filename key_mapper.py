@@ -206,9 +206,56 @@ def load_mapping_from_file(mapping_file: str) -> List[Dict[str, str]]:
         raise ValueError("Unexpected mapping file format")
 
 
+def _remap_keys(json_obj: Any, key_map: Dict[str, str]) -> Any:
+    """
+    Copy a JSON object, renaming every dict key found in key_map.
+    
+    Walks the tree with an explicit stack instead of recursion. Keys without
+    a mapping keep their original name.
+    
+    Args:
+        json_obj: The JSON object to map (can be dict, list, or primitive)
+        key_map: Lookup from current key to new key
+        
+    Returns:
+        New object with mapped keys
+    """
+    lookup = key_map.get
+    dict_t, list_t = dict, list
+    
+    # Each entry is (parent container, key/index in parent, object to copy);
+    # the holder list lets the root be handled like any other child
+    root = [json_obj]
+    stack = [(root, 0, json_obj)]
+    push, pop = stack.append, stack.pop
+    
+    while stack:
+        parent, slot, obj = pop()
+        obj_type = obj.__class__
+        if obj_type is dict_t:
+            new_obj = {}
+            for key, value in obj.items():
+                new_obj[lookup(key) or key] = value
+            children = new_obj.items()
+        elif obj_type is list_t:
+            new_obj = obj.copy()
+            children = enumerate(new_obj)
+        else:
+            # Primitive value (string, number, bool, None) - keep as-is
+            continue
+        
+        for child_slot, value in children:
+            value_type = value.__class__
+            if value_type is dict_t or value_type is list_t:
+                push((new_obj, child_slot, value))
+        parent[slot] = new_obj
+    
+    return root[0]
+
+
 def map_keys(json_obj: Any, mapping: List[Dict[str, str]]) -> Any:
     """
-    Recursively map obfuscated keys to deobfuscated keys.
+    Map obfuscated keys to deobfuscated keys throughout a JSON object.
     
     Args:
         json_obj: The JSON object to map (can be dict, list, or primitive)
@@ -217,30 +264,14 @@ def map_keys(json_obj: Any, mapping: List[Dict[str, str]]) -> Any:
     Returns:
         New object with mapped keys
     """
-    if isinstance(json_obj, list):
-        return [map_keys(item, mapping) for item in json_obj]
-    elif isinstance(json_obj, dict):
-        new_json = {}
-        # Create a lookup dictionary for faster searching
-        key_map = {m["Key"]: m["Value"] for m in mapping}
-        
-        for key, value in json_obj.items():
-            # Look up the mapped key
-            mapped_key = key_map.get(key)
-            if mapped_key:
-                new_json[mapped_key] = map_keys(value, mapping)
-            else:
-                # Keep original key if no mapping found
-                new_json[key] = map_keys(value, mapping)
-        return new_json
-    else:
-        # Primitive value (string, number, bool, None) - return as-is
-        return json_obj
+    # Build the lookup once for the whole tree
+    key_map = {m["Key"]: m["Value"] for m in mapping}
+    return _remap_keys(json_obj, key_map)
 
 
 def reverse_map_keys(json_obj: Any, mapping: List[Dict[str, str]]) -> Any:
     """
-    Recursively map deobfuscated keys back to obfuscated keys.
+    Map deobfuscated keys back to obfuscated keys throughout a JSON object.
     
     Args:
         json_obj: The JSON object to reverse map
@@ -249,25 +280,9 @@ def reverse_map_keys(json_obj: Any, mapping: List[Dict[str, str]]) -> Any:
     Returns:
         New object with reverse-mapped keys
     """
-    if isinstance(json_obj, list):
-        return [reverse_map_keys(item, mapping) for item in json_obj]
-    elif isinstance(json_obj, dict):
-        new_json = {}
-        # Create a reverse lookup dictionary
-        value_map = {m["Value"]: m["Key"] for m in mapping}
-        
-        for key, value in json_obj.items():
-            # Look up the original obfuscated key
-            original_key = value_map.get(key)
-            if original_key:
-                new_json[original_key] = reverse_map_keys(value, mapping)
-            else:
-                # Keep original key if no reverse mapping found
-                new_json[key] = reverse_map_keys(value, mapping)
-        return new_json
-    else:
-        # Primitive value - return as-is
-        return json_obj
+    # Build the reverse lookup once for the whole tree
+    value_map = {m["Value"]: m["Key"] for m in mapping}
+    return _remap_keys(json_obj, value_map)
 
 
 def is_mapped(json_obj: dict) -> bool:
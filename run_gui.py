@@ -7,12 +7,14 @@ PySide6 implementation
 import sys
 from PySide6.QtWidgets import QApplication
 from gui.qt_main_window import MainWindow
+from gui.qt_dropdown import install_nms_styles
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     
     # Set application style
     app.setStyle('Fusion')
+    install_nms_styles(app)
     
     window = MainWindow()
     window.show()
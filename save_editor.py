@@ -176,13 +176,14 @@ class SaveEditor:
         if self.selected_save_file_dict is None:
             raise ValueError("No save file decompressed. Please decompress a save file first.")
         
-        # Returns a generator of tuples (path, value)
-        base_keys = list(find_key_recursively(self.selected_save_file_dict, "PersistentPlayerBases"))
+        # Returns a generator of tuples (path, value); only the first match is
+        # needed, so stop walking the save tree as soon as it is found
+        base_key = next(find_key_recursively(self.selected_save_file_dict, "PersistentPlayerBases"), None)
         
-        if not base_keys:
+        if base_key is None:
             raise ValueError("Could not find PersistentPlayerBases in save file")
         
-        base_path, base_values = base_keys[0]
+        base_path, base_values = base_key
         self.bases_path = base_path
         self.all_bases = base_values
         
@@ -411,7 +412,6 @@ class SaveEditor:
         
         # Create backup if file already exists
         if os.path.exists(output_path):
-            from datetime import datetime
             backups_dir = self.project_directory / "backups" / "bases"
             if not backups_dir.exists():
                 backups_dir.mkdir(parents=True)
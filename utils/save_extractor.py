@@ -7,7 +7,10 @@ https://github.com/NMSCD/NMS-Save-Decoder/
 """
 
 import json
-import io
+import re
+import mmap
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -16,6 +19,21 @@ try:
 except ImportError:
     raise ImportError("lz4 module not found. Please install it with: pip install lz4")
 
+# Faster JSON parsing (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Set to False to force the standard library json module
+_FAST_JSON = orjson is not None
+
+# Matches '{' (group 1) or '}' for the brace-matching fallback
+_BRACE_PATTERN = re.compile(rb'(\{)|\}')
+
+# Block header: magic, compressed size, uncompressed size, padding
+_BLOCK_HEADER = struct.Struct('<IIII')
+
 # Import key mapping functions (optional)
 try:
     from key_mapper import map_keys, get_mapping
@@ -24,12 +42,7 @@ except ImportError:
     KEY_MAPPER_AVAILABLE = False
 
 
-def uint32(data: bytes) -> int:
-    """Convert 4 bytes to a little endian unsigned integer."""
-    return int.from_bytes(data, byteorder='little', signed=False) & 0xffffffff
-
-
-def decompress_save_file(data: bytes) -> bytes:
+def decompress_save_file(data: bytes, max_workers: int = 1) -> bytearray:
     """
     Decompresses a No Man's Sky save file that uses LZ4 compression.
     
@@ -42,60 +55,87 @@ def decompress_save_file(data: bytes) -> bytes:
       - Compressed data
     
     Args:
-        data: Raw bytes from the .hg file
+        data: Raw bytes from the .hg file, or an mmap of it
+        max_workers: Number of threads used to decompress blocks (default: 1)
         
     Returns:
-        Decompressed bytes
+        Decompressed bytes (returned as the bytearray they were written into,
+        avoiding a final copy)
     """
     size = len(data)
-    din = io.BytesIO(data)
-    out = bytearray()
+    pos = 0
+    blocks = []
     
-    while din.tell() < size:
-        magic = uint32(din.read(4))
+    # First pass: collect (offset, compressed size, uncompressed size) for
+    # every block so the output size is known up front
+    while pos + _BLOCK_HEADER.size <= size:
+        magic, compressedSize, uncompressedSize, _ = _BLOCK_HEADER.unpack_from(data, pos)
         if magic != 0xfeeda1e5:
-            # If we're not at a block boundary, try to find the next block
-            # or we've reached the end
-            if din.tell() >= size:
-                break
-            # Try to find the next block
-            remaining = din.read()
-            next_block = remaining.find(b'\xe5\xa1\xed\xfe')
+            # If we're not at a block boundary, search for the next block in
+            # place rather than copying the rest of the file
+            next_block = data.find(b'\xe5\xa1\xed\xfe', pos + 4)
             if next_block == -1:
                 break
-            din.seek(din.tell() - len(remaining) + next_block)
-            magic = uint32(din.read(4))
-            if magic != 0xfeeda1e5:
-                break
+            pos = next_block
+            continue
         
-        compressedSize = uint32(din.read(4))
-        uncompressedSize = uint32(din.read(4))
-        din.seek(4, 1)  # skip 4 bytes padding
-        compressed_data = din.read(compressedSize)
+        pos += _BLOCK_HEADER.size
         
-        if len(compressed_data) < compressedSize:
+        if pos + compressedSize > size:
             break
         
+        blocks.append((pos, compressedSize, uncompressedSize))
+        pos += compressedSize
+    
+    # Second pass: decompress each block straight into its slot of a
+    # buffer allocated once, instead of growing the output per block.
+    # The view is released before returning so an mmap can be closed.
+    out = bytearray(sum(block[2] for block in blocks))
+    out_pos = 0
+    
+    with memoryview(data) as view:
+        def decompress_block(block):
+            offset, compressedSize, uncompressedSize = block
+            return lz4.block.decompress(
+                view[offset:offset + compressedSize], uncompressed_size=uncompressedSize
+            )
+        
+        # lz4 releases the GIL while decompressing, so blocks can be
+        # decompressed on several threads; results still arrive in order
+        pool = None
+        if max_workers > 1 and len(blocks) > 1:
+            pool = ThreadPoolExecutor(max_workers=min(max_workers, len(blocks)))
+            decompressed_blocks = pool.map(decompress_block, blocks)
+        else:
+            decompressed_blocks = map(decompress_block, blocks)
+        
         try:
-            decompressed_block = lz4.block.decompress(compressed_data, uncompressed_size=uncompressedSize)
-            out += decompressed_block
+            for decompressed_block in decompressed_blocks:
+                out[out_pos:out_pos + len(decompressed_block)] = decompressed_block
+                out_pos += len(decompressed_block)
         except Exception as e:
             raise ValueError(f"Failed to decompress block: {e}")
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
     
-    return bytes(out)
+    # Drop any slack left by blocks smaller than their declared size
+    del out[out_pos:]
+    return out
 
 
-def extract_json_from_hg(hg_file_path: str) -> Dict[str, Any]:
+def extract_json_from_hg(hg_file_path: str, max_workers: int = 1) -> Dict[str, Any]:
     """
     Extract JSON from a No Man's Sky .hg save file.
     
     This function:
-    1. Reads the .hg file
+    1. Memory-maps the .hg file
     2. Decompresses it using LZ4
     3. Parses the JSON (which has obfuscated keys)
     
     Args:
         hg_file_path: Path to the .hg save file
+        max_workers: Number of threads used to decompress blocks (default: 1)
         
     Returns:
         Dictionary containing the parsed JSON data
@@ -109,26 +149,42 @@ def extract_json_from_hg(hg_file_path: str) -> Dict[str, Any]:
     if not file_path.exists():
         raise FileNotFoundError(f"Save file not found: {hg_file_path}")
     
-    with open(file_path, 'rb') as f:
-        data = f.read()
-    
     # Check for minimum file size
-    if len(data) < 18:
+    if file_path.stat().st_size < 18:
         raise ValueError("File too short to be a valid save file")
     
+    # Map the file rather than reading it into memory; the OS pages it in
+    # as the blocks are decompressed
+    with open(file_path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
     # Decompress the file
-    decompressed_data = decompress_save_file(data)
+    try:
+        decompressed_data = decompress_save_file(mm, max_workers)
+    finally:
+        mm.close()
     
     if len(decompressed_data) == 0:
         raise ValueError("Failed to decompress file - might not be a valid save file")
     
-    # The decompressed data should be pure JSON
+    # orjson parses the bytes directly. The JSON is usually followed by a null
+    # terminator, so leave that out; anything else orjson rejects falls
+    # through to the recovery path below.
+    if _FAST_JSON:
+        end = len(decompressed_data)
+        while end and decompressed_data[end - 1] == 0:
+            end -= 1
+        try:
+            return orjson.loads(memoryview(decompressed_data)[:end])
+        except orjson.JSONDecodeError:
+            pass
+    
+    # The decompressed data should be pure JSON. json.loads accepts the UTF-8
+    # bytes directly, so only the recovery paths below need a str.
     try:
-        json_str = decompressed_data.decode('utf-8')
-        
         # Try to parse the JSON
         try:
-            data = json.loads(json_str)
+            data = json.loads(decompressed_data)
             return data
         except json.JSONDecodeError as e:
             # If there's "Extra data", it means we parsed a complete JSON object
@@ -136,28 +192,30 @@ def extract_json_from_hg(hg_file_path: str) -> Dict[str, Any]:
             if "Extra data" in str(e):
                 # Use JSONDecoder to parse just the first object
                 decoder = json.JSONDecoder()
-                obj, idx = decoder.raw_decode(json_str)
+                obj, idx = decoder.raw_decode(decompressed_data.decode('utf-8'))
                 return obj
             else:
                 # Other JSON errors - try to find the first complete object
-                json_start = json_str.find('{')
+                json_start = decompressed_data.find(b'{')
                 if json_start == -1:
                     raise ValueError(f"Could not find JSON in decompressed data: {e}")
                 
-                # Try to find the matching closing brace
+                # Try to find the matching closing brace. The regex engine skips
+                # from brace to brace in C; braces inside strings are counted
+                # too, which the json.loads below catches.
                 brace_count = 0
                 end_pos = -1
-                for i in range(json_start, len(json_str)):
-                    if json_str[i] == '{':
+                for match in _BRACE_PATTERN.finditer(decompressed_data, json_start):
+                    if match.lastindex:
                         brace_count += 1
-                    elif json_str[i] == '}':
+                    else:
                         brace_count -= 1
                         if brace_count == 0:
-                            end_pos = i + 1
+                            end_pos = match.end()
                             break
                 
                 if end_pos > 0:
-                    partial_json = json_str[json_start:end_pos]
+                    partial_json = decompressed_data[json_start:end_pos]
                     data = json.loads(partial_json)
                     return data
                 else:
@@ -11,6 +11,15 @@ from typing import Optional, List, Dict, Any, Tuple
 
 from .base_or_corvette_detection import find_key_recursively
 
+# Faster JSON serialization (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Set to False to force the standard library json module
+_FAST_JSON = orjson is not None
+
 
 class SaveFileManager:
     """
@@ -36,6 +45,8 @@ class SaveFileManager:
         self._base_path: Optional[List[str]] = None
         self._has_changes: bool = False
         self._backup_path: Optional[str] = None
+        # Base indices grouped by base type, built on first use
+        self._by_type: Optional[Dict[str, List[int]]] = None
         
         if file_path:
             self.load(file_path)
@@ -77,14 +88,16 @@ class SaveFileManager:
             with open(file_path, 'r', encoding='utf-8') as f:
                 self._save_data = json.load(f)
             
-            # Find PersistentPlayerBases location
-            base_keys = list(find_key_recursively(self._save_data, "PersistentPlayerBases"))
-            if not base_keys:
+            # Find PersistentPlayerBases location, stopping at the first match
+            # instead of walking the rest of the save tree
+            base_key = next(find_key_recursively(self._save_data, "PersistentPlayerBases"), None)
+            if base_key is None:
                 raise ValueError("Could not find PersistentPlayerBases in save file")
             
-            self._base_path, _ = base_keys[0]
+            self._base_path, _ = base_key
             self._file_path = file_path
             self._has_changes = False
+            self._by_type = None
             return True
         except Exception as e:
             raise RuntimeError(f"Error loading file: {e}")
@@ -148,6 +161,38 @@ class SaveFileManager:
             if base.get("BaseType", {}).get("PersistentBaseTypes", "") == base_type
         ]
     
+    def get_bases_by_types(self, base_types: List[str]) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Get all bases matching any of the given types.
+        
+        The bases are grouped by type on the first call and the grouping is
+        reused until the bases array changes.
+        
+        Args:
+            base_types: The base types to keep (e.g., ["PlayerShipBase", "ExternalPlanetBase"]).
+            
+        Returns:
+            List of (index, base) tuples in save file order, where index is the
+            base's position in the PersistentPlayerBases array.
+        """
+        bases_array = self._get_bases_array()
+        
+        # Scan the bases once per load; afterwards each query only touches
+        # the indices of the requested types
+        if self._by_type is None:
+            by_type = {}
+            for index, base in enumerate(bases_array):
+                base_type = base.get("BaseType", {}).get("PersistentBaseTypes", "")
+                by_type.setdefault(base_type, []).append(index)
+            self._by_type = by_type
+        
+        indices = sorted(
+            index
+            for base_type in frozenset(base_types)
+            for index in self._by_type.get(base_type, ())
+        )
+        return [(index, bases_array[index]) for index in indices]
+    
     def get_base_by_index(self, index: int) -> Optional[Dict[str, Any]]:
         """
         Get a base by its index in the save file.
@@ -203,6 +248,7 @@ class SaveFileManager:
         
         bases_array[index] = new_base_data
         self._has_changes = True
+        self._by_type = None
         return True
     
     def add_base(self, base_data: Dict[str, Any]) -> int:
@@ -218,6 +264,7 @@ class SaveFileManager:
         bases_array = self._get_bases_array()
         bases_array.append(base_data)
         self._has_changes = True
+        self._by_type = None
         return len(bases_array) - 1
     
     def remove_base(self, index: int) -> bool:
@@ -237,6 +284,7 @@ class SaveFileManager:
         
         bases_array.pop(index)
         self._has_changes = True
+        self._by_type = None
         return True
     
     def get_base_count(self) -> int:
@@ -284,6 +332,8 @@ class SaveFileManager:
         backup_filename = f"{Path(self._file_path).stem}_backup_{timestamp}.json"
         self._backup_path = str(backup_dir / backup_filename)
         
+        # A real copy: a hard link would share its contents with the original
+        # and follow any writer that rewrites the file in place
         shutil.copy2(self._file_path, self._backup_path)
         return self._backup_path
     
@@ -309,25 +359,43 @@ class SaveFileManager:
         if create_backup and not self._backup_path:
             self.create_backup()
         
+        # Serialize once, then write to a temporary file and swap it in so an
+        # interrupted save never leaves a truncated file behind
+        temp_path = f"{save_path}.tmp"
         try:
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(self._save_data, f, indent=2, ensure_ascii=False)
+            if _FAST_JSON:
+                buf = orjson.dumps(self._save_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                buf = json.dumps(self._save_data, indent=2, ensure_ascii=False).encode('utf-8')
+            
+            with open(temp_path, 'wb', buffering=1 << 20) as f:
+                f.write(buf)
+            os.replace(temp_path, save_path)
             
             self._has_changes = False
             if file_path and file_path != self._file_path:
                 self._file_path = file_path
             return True
         except Exception as e:
+            # Clean up temp file on error
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
             raise RuntimeError(f"Error saving file: {e}")
     
     def export_bases(self, base_types: Optional[List[str]] = None, 
-                    output_dir: Optional[str] = None) -> Tuple[str, str]:
+                    output_dir: Optional[str] = None,
+                    bases: Optional[List[Dict[str, Any]]] = None) -> Tuple[str, str]:
         """
         Export bases to JSON and CSV files.
         
         Args:
             base_types: List of base types to export. If None, exports all bases.
             output_dir: Directory to save exported files. Defaults to "output".
+            bases: Already filtered bases to export. If given, base_types is
+                   ignored and the save data is not scanned again.
             
         Returns:
             Tuple of (json_file_path, csv_file_path).
@@ -341,12 +409,13 @@ class SaveFileManager:
         output_dir.mkdir(exist_ok=True)
         
         # Get bases to export
-        if base_types:
-            bases = []
-            for base_type in base_types:
-                bases.extend(self.get_bases_by_type(base_type))
-        else:
-            bases = self.get_bases()
+        if bases is None:
+            if base_types:
+                bases = []
+                for base_type in base_types:
+                    bases.extend(self.get_bases_by_type(base_type))
+            else:
+                bases = self.get_bases()
         
         # Save to JSON
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')